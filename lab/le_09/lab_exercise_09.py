@@ -3,6 +3,46 @@ import json
 import requests
 import pprint
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_SIZE = 10 # connections kept alive per host
+HTTP_TIMEOUT = 10 # seconds
+HTTP_RETRIES = 3 # transport-level retries per GET request
+HTTP_BACKOFF_FACTOR = 0.5 # seconds; base of the exponential backoff
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session(pool_size=HTTP_POOL_SIZE, retries=HTTP_RETRIES,
+                   backoff_factor=HTTP_BACKOFF_FACTOR, status_forcelist=HTTP_RETRY_STATUSES):
+    """Returns a new < requests.Session > whose transport adapters keep up to < pool_size >
+    keep-alive connections open per host. Failed GET requests (connection errors and responses
+    whose status code is in < status_forcelist >) are retried up to < retries > times with
+    exponential backoff.
+
+    Parameters:
+        pool_size (int): connections kept alive per host
+        retries (int): maximum number of retries per request
+        backoff_factor (float): backoff factor applied between retries
+        status_forcelist (tuple): HTTP status codes that trigger a retry
+
+    Returns:
+        requests.Session: configured session
+    """
+
+    retry = Retry(total=retries, backoff_factor=backoff_factor,
+                  status_forcelist=status_forcelist, allowed_methods=('GET',),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    new_session = requests.Session()
+    new_session.mount('https://', adapter)
+    new_session.mount('http://', adapter)
+    return new_session
+
+
+# Shared session: reuses keep-alive connections across requests
+session = create_session()
+
 print(f'\nLab Exercise 09')
 print(f'\n20th Century Fox')
 print(f'\nA LUCASFILM LIMITED Production')
@@ -37,7 +77,7 @@ dialogue = {
 
 # PROBLEM 01
 
-def get_swapi_resource(url, params=None, timeout=10):
+def get_swapi_resource(url, params=None, timeout=HTTP_TIMEOUT):
     """Returns a response object decoded into a dictionary. If query string < params > are
     provided the response object body is returned in the form on an "envelope" with the data
     payload of one or more SWAPI entities to be found in ['results'] list; otherwise, response
@@ -53,9 +93,9 @@ def get_swapi_resource(url, params=None, timeout=10):
     """
 
     if params:
-        return requests.get(url, params, timeout=timeout).json()
+        return session.get(url, params=params, timeout=timeout).json()
     else:
-        return requests.get(url, timeout=timeout).json()
+        return session.get(url, timeout=timeout).json()
 
 
 # PROBLEM 02
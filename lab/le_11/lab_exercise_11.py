@@ -72,15 +72,17 @@ def enrich_planet(planet, wookiee_planets, filters):
 
     Parameters:
         planet (dict): a dictionary representation of the decoded JSON that contains planet attributes.
-        wookiee_planets (list): a list of dictionaries containing planet attributes sourced from Wookieepedia.
+        wookiee_planets (list|dict): a list of dictionaries containing planet attributes sourced from Wookieepedia,
+                                     or an index of that list built once by < utl.create_name_index >.
         filters (tuple): a list containing names of planet attributes.
 
     Returns:
         dict: an enriched dictionary of key-value pairs representing a planet.
     """
-    for wookiee_planet in wookiee_planets:
-        if wookiee_planet['name'].lower() == planet['name'].lower():
-            planet.update(wookiee_planet)
+    if not isinstance(wookiee_planets, dict):
+        wookiee_planets = utl.create_name_index(wookiee_planets)
+    for wookiee_planet in wookiee_planets.get(planet['name'].casefold(), []):
+        planet.update(wookiee_planet)
 
     new_planets = {}
     for key, val in planet.items():
@@ -144,8 +146,9 @@ def main():
                     'primary_languages'
     )
 
+    wookiee_homeworld_index = utl.create_name_index(wookiee_homeworlds) # built once, not per villain
     for villain in villains_created:
-        villain['homeworld'] = enrich_planet(villain['homeworld'], wookiee_homeworlds, key_filters)
+        villain['homeworld'] = enrich_planet(villain['homeworld'], wookiee_homeworld_index, key_filters)
 
 
 
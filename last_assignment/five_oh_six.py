@@ -1,19 +1,1912 @@
+import asyncio
+import atexit
+import bisect
 import csv
+import functools
+import gzip
+import importlib
+import itertools
 import json
+import lzma
+import os
+import random
 import requests
+import sqlite3
+import struct
+import tempfile
+import threading
+import time
+import unicodedata
+import zlib
 
-from urllib.parse import quote, urlencode, urljoin
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+from urllib.parse import parse_qsl, quote, urlencode, urlparse, urlsplit
+from urllib3.util.retry import Retry
 
 
 # Constants
-CACHE_FILEPATH = './CACHE.json'
 NONE_VALUES = ('', 'n/a', 'none', 'unknown')
-SWAPI_ENDPOINT = 'https://swapi.py4e.com/api'
+CACHE_FILEPATH = os.environ.get('CACHE_FILEPATH', './CACHE.json')
+SWAPI_ENDPOINT = os.environ.get('SWAPI_ENDPOINT', 'https://swapi.py4e.com/api').rstrip('/')
 SWAPI_CATEGORES = f"{SWAPI_ENDPOINT}/"
 SWAPI_PEOPLE = f"{SWAPI_ENDPOINT}/people/"
 SWAPI_PLANETS = f"{SWAPI_ENDPOINT}/planets/"
 SWAPI_SPECIES = f"{SWAPI_ENDPOINT}/species/"
 SWAPI_STARSHIPS = f"{SWAPI_ENDPOINT}/starships/"
+SWAPI_FILMS = f"{SWAPI_ENDPOINT}/films/"
+SWAPI_VEHICLES = f"{SWAPI_ENDPOINT}/vehicles/"
+SWAPI_SEARCH_FIELDS = {'films': 'title'} # searchable field if not "name"
+
+# Write-behind flush thresholds
+CACHE_FLUSH_MAX_PENDING = 50 # dirty entries
+CACHE_FLUSH_MAX_DELAY = 5.0 # seconds
+CACHE_JOURNAL_SUFFIX = '.journal' # flushed entries awaiting compaction into the cache file
+
+# HTTP connection pool (see create_session)
+HTTP_POOL_SIZE = 10 # connections kept alive per host
+HTTP_HOST_POOL_SIZES = {} # e.g., {'swapi.py4e.com': 32}
+HTTP_TIMEOUT = 10 # seconds
+HTTP_CONCURRENCY = 8 # concurrent requests issued by resolve_urls
+
+# Request resilience (see get_resource)
+HTTP_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5 # seconds; base of the exponential backoff
+HTTP_BACKOFF_MAX = 8.0 # seconds
+HTTP_DEADLINE = 30.0 # seconds; total budget per request, retries included
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+CIRCUIT_FAILURE_THRESHOLD = 5 # consecutive failures that open a host's circuit
+CIRCUIT_RESET_TIMEOUT = 30.0 # seconds an open circuit waits before a trial request
+
+# Cache bounds: maximum entries, maximum (approximate) bytes, per-category TTLs in seconds
+CACHE_MAX_ENTRIES = 10000
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_TTLS = {} # e.g., {'people': 86400, 'planets': 604800}
+SQLITE_CACHE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+COMPRESSED_CACHE_EXTENSIONS = {'.cz': 'zlib', '.cgz': 'gzip', '.cxz': 'lzma'} # -> codec
+COMPRESSED_CACHE_MAGIC = b'506CACH2'
+COMPRESSED_CACHE_ZDICT_SIZE = 32 * 1024 # zlib preset dictionary (window size) in bytes
+COMPRESSED_CACHE_COMPACT_RATIO = 2 # rewrite the file once it exceeds live data x ratio
+
+# Negative cache: seconds an empty or "Not found" response is remembered (in-process only)
+NEGATIVE_CACHE_TTL = 300
+
+# Cache keys: distinct (url, params) pairs memoized by canonicalize_cache_key
+CACHE_KEY_MEMO_SIZE = 4096
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Entity names: distinct names memoized by normalize_name and fold_name
+NAME_KEY_MEMO_SIZE = 65536
+FUZZY_MAX_DISTANCE = 2 # maximum edit distance accepted by FuzzyNameIndex
+
+# Cache value modes: 'copy' (deep copy), 'cow' (copy-on-write), 'frozen' (read-only)
+CACHE_VALUE_MODE = 'cow'
+
+# Streaming JSON reader: characters read from the file per refill (see stream_json_array)
+JSON_BUFFER_SIZE = 64 * 1024
+JSON_WHITESPACE = ' \t\n\r'
+
+# JSON serialization backends, fastest first (see get_json_backend). Set the JSON_BACKEND
+# environment variable (e.g., JSON_BACKEND=json) to select a backend explicitly.
+JSON_BACKENDS = ('orjson', 'ujson', 'json')
+JSON_BACKEND = os.environ.get('JSON_BACKEND')
+JSON_COMPACT_SEPARATORS = (',', ':')
+
+# Negative cache entries: cache key -> expiry (see get_cached_resource)
+negative_cache = {}
+
+# Prefetched category search indexes, keyed by category cache key (see prefetch_category)
+search_indexes = {}
+
+# Circuit breakers, keyed by host (see get_circuit_breaker)
+circuit_breakers = {}
+circuit_breakers_lock = threading.Lock()
+
+# Shared JSON backend (see get_json_backend)
+json_backend = None
+
+# Shared HTTP session and the keyword arguments it was created with (see get_session)
+session = None
+session_kwargs = {}
+session_lock = threading.Lock()
+
+
+class CacheWriter:
+    """Write-behind persistence for a cache. Rather than rewriting the cache file on every
+    cache miss, callers report new or changed entries via < mark_dirty >. Dirty entries are
+    collected and flushed in a single batch once either < max_pending > entries are waiting or
+    < max_delay > seconds have elapsed since the first unflushed change. The delayed flush is
+    scheduled on a daemon < threading.Timer > when the first entry becomes dirty, so it happens
+    even if no further changes are reported. Any remaining entries are flushed, and the journal
+    compacted, at interpreter exit (see < close >).
+
+    Each dirty entry's value and creation time are captured when it is marked, so an entry that
+    a bounded < LRUCache > evicts before the flush is still written. A flush appends the dirty
+    entries to a journal (< filepath > plus < CACHE_JOURNAL_SUFFIX >, one JSON line per entry;
+    see < stream_cache_journal >), so its cost is proportional to the batch rather than to the
+    size of the cache file. < create_cache > replays the journal after loading the file.
+
+    Once the journal grows larger than the cache file it is compacted (see < compact >): the
+    existing file is streamed entry by entry (see < stream_json_object >), journaled keys are
+    moved to the end (most recently used last), and the result is written with
+    < write_json_object_atomic > so that a crash mid-write never leaves a truncated cache file
+    behind. As a rewrite costs at most twice the journal it absorbs, the total cost of the
+    rewrites over a crawl is linear, not quadratic, in the number of entries written. Entries are stored as
+    {"created_at": <epoch>, "value": <resource>} (see < unpack_cache_entry >). Caches that
+    manage their own storage (e.g., < SQLiteCache >) are flushed by calling their < persist >
+    method with the dirty keys instead.
+
+    Parameters:
+        filepath (str): path to the cache file
+        cache (dict|LRUCache|SQLiteCache|CompressedCache): cache to persist
+        max_pending (int): number of dirty entries that triggers a flush
+        max_delay (float): seconds a dirty entry may wait before a flush is triggered
+    """
+
+    def __init__(self, filepath, cache, max_pending=CACHE_FLUSH_MAX_PENDING,
+                 max_delay=CACHE_FLUSH_MAX_DELAY):
+        self.filepath = filepath
+        self.journal_filepath = filepath + CACHE_JOURNAL_SUFFIX
+        self.cache = cache
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self.dirty = {} # key -> stored entry (None if the cache persists itself)
+        self.timer = None
+        self.lock = threading.RLock()
+        atexit.register(self.close)
+
+    def close(self):
+        """Flushes any remaining dirty entries and compacts the journal into the cache file.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.flush()
+            self.compact()
+
+    def compact(self):
+        """Merges the journal into < filepath > and removes it. Only the keys of the journal
+        are held in memory; the cache file and the journal are both streamed.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            last_lines = {} # key -> index of its most recent journal entry
+            for i, (key, entry) in enumerate(stream_cache_journal(self.journal_filepath)):
+                last_lines[key] = i
+            if not last_lines:
+                return None
+            write_json_object_atomic(self.filepath, self._merge(last_lines))
+            os.remove(self.journal_filepath)
+
+    def mark_dirty(self, key):
+        """Records < key > as changed and flushes the cache if a threshold has been reached.
+
+        Parameters:
+            key (str): cache key of the new or changed entry
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            if hasattr(self.cache, 'persist'):
+                self.dirty[key] = None
+            else:
+                try:
+                    if hasattr(self.cache, 'peek'):
+                        value, created_at = self.cache.peek(key)
+                    else:
+                        value, created_at = self.cache[key], time.time()
+                except KeyError:
+                    return None # already expired (e.g., a time-to-live of zero)
+                self.dirty.pop(key, None) # re-marked keys move to the end
+                self.dirty[key] = {'created_at': created_at, 'value': value}
+            if len(self.dirty) >= self.max_pending:
+                self.flush()
+            elif self.timer is None:
+                self.timer = threading.Timer(self.max_delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Appends the dirty entries to the journal if there are any, compacting the journal
+        once it outgrows the cache file.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel() # no-op if called from the timer thread itself
+                self.timer = None
+            if not self.dirty:
+                return None
+            if hasattr(self.cache, 'persist'):
+                self.cache.persist(list(self.dirty))
+                self.dirty.clear()
+                return None
+            self._append(self.dirty)
+            self.dirty.clear()
+            try:
+                file_size = os.path.getsize(self.filepath)
+            except FileNotFoundError:
+                file_size = 0
+            if os.path.getsize(self.journal_filepath) > file_size:
+                self.compact()
+
+    def _append(self, entries):
+        dumps = get_json_backend().dumps
+        with open(self.journal_filepath, 'a+b') as file_obj:
+            lines = [dumps([key, entry], False, None, JSON_COMPACT_SEPARATORS)
+                     for key, entry in entries.items()]
+            data = ('\n'.join(lines) + '\n').encode('utf-8')
+            if file_obj.tell():
+                file_obj.seek(-1, os.SEEK_END)
+                if file_obj.read(1) != b'\n':
+                    data = b'\n' + data # terminate a line torn by an interrupted append
+            file_obj.write(data)
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+
+    def _merge(self, last_lines):
+        try:
+            created_at = os.path.getmtime(self.filepath)
+            for key, entry in stream_json_object(self.filepath):
+                if key not in last_lines:
+                    value, entry_created_at = unpack_cache_entry(entry, created_at)
+                    yield key, {'created_at': entry_created_at, 'value': value}
+        except FileNotFoundError:
+            pass
+        for i, (key, entry) in enumerate(stream_cache_journal(self.journal_filepath)):
+            if last_lines[key] == i:
+                yield key, entry # most recent entry, in journal order
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker. After < failure_threshold > consecutive failures the circuit
+    "opens" and requests to the host fail fast (see < allow >) for < reset_timeout > seconds.
+    The circuit then "half-opens", permitting a single trial request: success closes the
+    circuit, failure opens it again.
+
+    Parameters:
+        failure_threshold (int): consecutive failures that open the circuit
+        reset_timeout (float): seconds the circuit stays open before a trial request
+    """
+
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout=CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial = False
+        self.lock = threading.Lock()
+
+    def allow(self):
+        """Returns True if a request may be issued: the circuit is closed, or it has been open
+        for at least < reset_timeout > seconds and no other trial request is in flight.
+
+        Parameters:
+            None
+
+        Returns:
+            bool: True if the request may proceed; otherwise False
+        """
+
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if self.trial or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.trial = True # half-open
+            return True
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.trial = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial = False
+
+
+class CircuitOpenError(Exception):
+    """Raised by < get_resource > when a host's circuit breaker is open."""
+
+
+class CompressedCache:
+    """Compact on-disk cache container. Each entry is serialized as compact JSON and compressed
+    independently with < codec >: 'zlib' (default) compresses every entry against a shared
+    preset dictionary (zdict) so that the keys and URLs common to SWAPI resources are not
+    repeated in each blob; 'gzip' and 'lzma' compress each entry on its own. The zdict is
+    sampled from the first entries written and stored once in the file header:
+
+    < COMPRESSED_CACHE_MAGIC > | index offset (8 bytes) | index length (4 bytes) |
+    zdict length (4 bytes) | zdict | blobs ... | zlib-compressed JSON index
+
+    The index maps each key to the offset and length of its compressed blob. Opening the cache
+    reads the header and the index only; an entry is decompressed and decoded the first time
+    it is accessed and returned frozen (see < freeze >). New entries are held in memory until
+    < persist > appends their blobs and a new index to the end of the file and then repoints
+    the header at the new index, so each flush writes only the new entries and the index. A
+    crash before the header is updated leaves the previous index in force. Superseded blobs
+    and indexes are reclaimed by < compact >, which runs automatically once the file exceeds
+    < COMPRESSED_CACHE_COMPACT_RATIO > times the size of its live content.
+
+    Parameters:
+        filepath (str): path to the cache file
+        codec (str): 'zlib', 'gzip', or 'lzma'; ignored if the file exists (its own codec is
+                     used)
+    """
+
+    codecs = {
+        'gzip': (gzip.compress, gzip.decompress),
+        'lzma': (lzma.compress, lzma.decompress)
+    }
+    header_format = '>QII' # index offset, index length, zdict length
+
+    def __init__(self, filepath, codec='zlib'):
+        self.filepath = filepath
+        self.codec = codec
+        self.zdict = b''
+        self.index = {} # key -> [offset, length]
+        self.decoded = {}
+        self.pending = {}
+        self.changed = False
+        self.file_obj = None
+        self.data_offset = 0 # end of the header and zdict
+        self.index_length = 0
+        self.lock = threading.RLock()
+        self._open()
+
+    def __contains__(self, key):
+        return key in self.pending or key in self.index
+
+    def __delitem__(self, key):
+        with self.lock:
+            if key not in self:
+                raise KeyError(key)
+            self.pending.pop(key, None)
+            self.decoded.pop(key, None)
+            self.index.pop(key, None)
+            self.changed = True
+
+    def __getitem__(self, key):
+        with self.lock:
+            if key in self.pending:
+                return self.pending[key]
+            if key in self.decoded:
+                return self.decoded[key]
+            text = self._decompress(self._read_blob(key))
+            value = freeze(get_json_backend().loads(text))
+            self.decoded[key] = value
+            return value
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.index.keys() | self.pending.keys())
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.pending[key] = freeze(value)
+            self.decoded.pop(key, None)
+            self.changed = True
+
+    def close(self):
+        """Persists any pending entries and closes the cache file.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.persist()
+            if self.file_obj:
+                self.file_obj.close()
+                self.file_obj = None
+
+    def compact(self):
+        """Atomically rewrites the cache file with the live blobs only, discarding superseded
+        blobs and indexes. Blobs are copied without being decompressed.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.persist(compact=False)
+            if self.file_obj is None:
+                return None
+            dirpath = os.path.dirname(os.path.abspath(self.filepath))
+            fd, tmp_filepath = tempfile.mkstemp(dir=dirpath, prefix='.tmp-', suffix='.cache')
+            try:
+                with os.fdopen(fd, 'w+b') as file_obj:
+                    self._write_header(file_obj)
+                    index = {}
+                    for key in self.index:
+                        blob = self._read_blob(key)
+                        index[key] = [file_obj.tell(), len(blob)]
+                        file_obj.write(blob)
+                    self._write_index(file_obj, index)
+                self.file_obj.close()
+                self.file_obj = None
+                os.replace(tmp_filepath, self.filepath)
+            except BaseException:
+                if os.path.exists(tmp_filepath):
+                    os.remove(tmp_filepath)
+                raise
+            self._open()
+
+    def copy(self):
+        """Returns a plain dictionary of every entry. Decodes the entire cache; intended for
+        exports only.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: key-value pairs
+        """
+
+        return dict(self.items())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def keys(self):
+        return list({**self.index, **self.pending}.keys())
+
+    def persist(self, keys=None, compact=True):
+        """Appends the pending entries and a new index to the cache file and repoints the
+        header at the new index, creating the file (and sampling the zdict) if it does not yet
+        exist. All pending entries are written, whether or not they are included in < keys >
+        (accepted for compatibility with < CacheWriter >). If < compact > is True the file is
+        then compacted if it has outgrown its live content (see < compact >).
+
+        Parameters:
+            keys (iterable): ignored
+            compact (bool): compact the file if warranted
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            if not self.changed and self.file_obj is not None:
+                return None
+            if self.file_obj is None:
+                if self.codec == 'zlib':
+                    self.zdict = self._sample_zdict()
+                self.file_obj = open(self.filepath, 'w+b')
+                self._write_header(self.file_obj)
+
+            file_obj = self.file_obj
+            file_obj.seek(0, os.SEEK_END)
+            for key, value in self.pending.items():
+                text = get_json_backend().dumps(value, separators=JSON_COMPACT_SEPARATORS)
+                blob = self._compress(text.encode('utf-8'))
+                self.index[key] = [file_obj.tell(), len(blob)]
+                file_obj.write(blob)
+            self._write_index(file_obj, self.index)
+
+            self.decoded.update(self.pending)
+            self.pending.clear()
+            self.changed = False
+
+            if compact:
+                live = sum(length for offset, length in self.index.values())
+                live += self.index_length + self.data_offset
+                if file_obj.seek(0, os.SEEK_END) > live * COMPRESSED_CACHE_COMPACT_RATIO:
+                    self.compact()
+
+    def values(self):
+        return [value for key, value in self.items()]
+
+    def _compress(self, data):
+        if self.codec != 'zlib':
+            return self.codecs[self.codec][0](data)
+        compressor = zlib.compressobj(9, zdict=self.zdict) if self.zdict else zlib.compressobj(9)
+        return compressor.compress(data) + compressor.flush()
+
+    def _decompress(self, blob):
+        if self.codec != 'zlib':
+            return self.codecs[self.codec][1](blob)
+        if self.zdict:
+            return zlib.decompressobj(zdict=self.zdict).decompress(blob)
+        return zlib.decompress(blob)
+
+    def _open(self):
+        try:
+            file_obj = open(self.filepath, 'r+b')
+        except FileNotFoundError:
+            return None
+        if file_obj.read(len(COMPRESSED_CACHE_MAGIC)) != COMPRESSED_CACHE_MAGIC:
+            file_obj.close()
+            raise ValueError(f"{self.filepath} is not a compressed cache file")
+        index_offset, index_length, zdict_length = struct.unpack(
+            self.header_format, file_obj.read(struct.calcsize(self.header_format)))
+        self.zdict = file_obj.read(zdict_length)
+        self.data_offset = file_obj.tell()
+        file_obj.seek(index_offset)
+        header = json.loads(zlib.decompress(file_obj.read(index_length)))
+        self.codec = header['codec']
+        self.index = header['entries']
+        self.index_length = index_length
+        self.file_obj = file_obj
+
+    def _read_blob(self, key):
+        offset, length = self.index[key]
+        self.file_obj.seek(offset)
+        return self.file_obj.read(length)
+
+    def _sample_zdict(self):
+        # The most useful strings belong at the end of a zdict, so sample the last entries
+        samples = []
+        size = 0
+        for value in reversed(list(self.pending.values())):
+            sample = get_json_backend().dumps(value, separators=JSON_COMPACT_SEPARATORS)
+            samples.append(sample.encode('utf-8'))
+            size += len(samples[-1])
+            if size >= COMPRESSED_CACHE_ZDICT_SIZE:
+                break
+        return b''.join(reversed(samples))[-COMPRESSED_CACHE_ZDICT_SIZE:]
+
+    def _write_header(self, file_obj):
+        file_obj.write(COMPRESSED_CACHE_MAGIC)
+        file_obj.write(struct.pack(self.header_format, 0, 0, len(self.zdict)))
+        file_obj.write(self.zdict)
+        self.data_offset = file_obj.tell()
+
+    def _write_index(self, file_obj, index):
+        # Append the index, make it durable, then repoint the header at it
+        data = zlib.compress(json.dumps(
+            {'codec': self.codec, 'entries': index}, separators=(',', ':')).encode('utf-8'))
+        index_offset = file_obj.seek(0, os.SEEK_END)
+        file_obj.write(data)
+        file_obj.flush()
+        os.fsync(file_obj.fileno())
+        file_obj.seek(len(COMPRESSED_CACHE_MAGIC))
+        file_obj.write(struct.pack('>QI', index_offset, len(data)))
+        file_obj.flush()
+        os.fsync(file_obj.fileno())
+        self.index_length = len(data)
+
+
+class CopyOnWriteDict(dict):
+    """Mutable dictionary view of a frozen cache value. Only the top-level key-value pairs are
+    copied when the view is created. Nested < FrozenDict > and tuple values are wrapped in their
+    own copy-on-write views the first time they are read, whether by key (< data['results'] >,
+    < get >, < pop >, < setdefault >), via < items() > or < values() >, or by copying the view
+    (< {**data} >, < dict(data) >, < copy() >), so a caller that mutates a nested value never
+    touches the shared cache value. Views compare equal to their thawed (plain) equivalent.
+
+    Parameters:
+        source (dict): frozen cache value
+    """
+
+    def __eq__(self, other):
+        if not isinstance(other, dict):
+            return NotImplemented
+        return thaw(self) == thaw(other)
+
+    def __getitem__(self, key):
+        return self._wrap(key, dict.__getitem__(self, key))
+
+    def __iter__(self):
+        # Overriding __iter__ stops dict() and {**data} from copying the raw values directly;
+        # they fall back to keys() and __getitem__ instead.
+        return dict.__iter__(self)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def copy(self):
+        return CopyOnWriteDict(self)
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self):
+        self._wrap_all()
+        return dict.items(self)
+
+    def pop(self, key, *default):
+        return get_cow_view(dict.pop(self, key, *default))
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        return key, get_cow_view(value)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def values(self):
+        self._wrap_all()
+        return dict.values(self)
+
+    def _wrap(self, key, value):
+        view = get_cow_view(value)
+        if view is not value:
+            dict.__setitem__(self, key, view)
+        return view
+
+    def _wrap_all(self):
+        for key, value in dict.items(self):
+            if isinstance(value, (FrozenDict, tuple)):
+                dict.__setitem__(self, key, get_cow_view(value)) # replaces value; size unchanged
+
+
+class CopyOnWriteList(list):
+    """Mutable list view of a frozen (tuple) cache value. Nested < FrozenDict > and tuple
+    elements are wrapped in copy-on-write views the first time they are accessed by index,
+    during iteration (forward or < reversed() >), or by < pop >. Views compare equal to their
+    thawed (plain) equivalent.
+
+    Parameters:
+        source (tuple): frozen cache value
+    """
+
+    def __eq__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        return thaw(self) == thaw(other)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._wrap(index, list.__getitem__(self, index))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __reversed__(self):
+        for i in range(len(self) - 1, -1, -1):
+            yield self[i]
+
+    def copy(self):
+        return self[:]
+
+    def pop(self, index=-1):
+        return get_cow_view(list.pop(self, index))
+
+    def _wrap(self, index, value):
+        view = get_cow_view(value)
+        if view is not value:
+            list.__setitem__(self, index, view)
+        return view
+
+
+class FrozenDict(dict):
+    """Read-only dictionary used to store cache values. Subclassing < dict > keeps frozen values
+    JSON serializable; any attempt to mutate the dictionary raises a < TypeError >. Copying a
+    < FrozenDict > with the < copy > module returns a plain, mutable dictionary.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError(f"{type(self).__name__} is read-only; call thaw() for a mutable copy")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+
+
+class FuzzyNameIndex:
+    """Approximate name matching over a list of records. Names are folded (see < fold_name >)
+    so that case, accents, and punctuation spacing are ignored ('Padmé Amidala' matches
+    'padme amidala'). Folded names are split into character trigrams and stored in an inverted
+    index; a search only considers records that share enough trigrams with the search term to
+    be within < max_distance > edits, and verifies those candidates with a bounded Levenshtein
+    (edit) distance calculation.
+
+    Parameters:
+        records (list): nested dictionaries (e.g., Wookieepedia-sourced entities)
+        key (str): key whose value identifies a record
+        max_distance (int): maximum edit distance between a search term and a match
+    """
+
+    def __init__(self, records, key='name', max_distance=FUZZY_MAX_DISTANCE):
+        self.records = records
+        self.key = key
+        self.max_distance = max_distance
+        self.names = []
+        self.exact = {}
+        self.postings = {}
+        for i, record in enumerate(records):
+            name = fold_name(record.get(key))
+            self.names.append(name)
+            self.exact.setdefault(name, []).append(i)
+            for trigram in set(get_trigrams(name)):
+                self.postings.setdefault(trigram, []).append(i)
+
+    def best(self, name):
+        """Returns the record that best matches < name >, or None if no record is within
+        < max_distance > edits.
+
+        Parameters:
+            name (str): search term
+
+        Returns:
+            dict|None: best matching record
+        """
+
+        matches = self.search(name, limit=1)
+        return matches[0][0] if matches else None
+
+    def search(self, name, limit=5, max_distance=None):
+        """Returns up to < limit > (record, distance) tuples whose names are within
+        < max_distance > edits of < name >, closest first.
+
+        Parameters:
+            name (str): search term
+            limit (int): maximum number of matches returned
+            max_distance (int): optional override of the index's maximum edit distance
+
+        Returns:
+            list: (record, distance) tuples
+        """
+
+        if max_distance is None:
+            max_distance = self.max_distance
+        name = fold_name(name)
+        if name in self.exact:
+            return [(self.records[i], 0) for i in self.exact[name][:limit]]
+
+        # a name within k edits of the term shares at least len(trigrams) - 3k trigrams
+        trigrams = set(get_trigrams(name))
+        counts = {}
+        for trigram in trigrams:
+            for i in self.postings.get(trigram, ()):
+                counts[i] = counts.get(i, 0) + 1
+        threshold = max(1, len(trigrams) - 3 * max_distance)
+
+        matches = []
+        for i, count in counts.items():
+            if count < threshold or abs(len(self.names[i]) - len(name)) > max_distance:
+                continue
+            distance = get_edit_distance(name, self.names[i], max_distance)
+            if distance is not None:
+                matches.append((distance, -count, i))
+        matches.sort()
+        return [(self.records[i], distance) for distance, count, i in matches[:limit]]
+
+
+class GroupedStats(dict):
+    """Dictionary of < RunningStats > keyed by group (e.g., news desk, subject keyword, year).
+    A group's statistics are created the first time a value is added to the group and the
+    group is dropped once its last value is removed.
+    """
+
+    def add(self, key, value):
+        """Adds < value > to the statistics of the < key > group.
+
+        Parameters:
+            key (obj): group key
+            value (int|float): value to add
+
+        Returns:
+            None
+        """
+
+        stats = self.get(key)
+        if stats is None:
+            stats = self[key] = RunningStats()
+        stats.add(value)
+
+    def merge(self, other):
+        """Merges the groups of < other > (a < GroupedStats > instance) into this instance.
+
+        Parameters:
+            other (GroupedStats): statistics to merge
+
+        Returns:
+            GroupedStats: this instance
+        """
+
+        for key, stats in other.items():
+            self.setdefault(key, RunningStats()).merge(stats)
+        return self
+
+    def remove(self, key, value):
+        """Removes a previously added < value > from the statistics of the < key > group.
+
+        Parameters:
+            key (obj): group key
+            value (int|float): value to remove
+
+        Returns:
+            None
+        """
+
+        stats = self[key]
+        stats.remove(value)
+        if not stats.count:
+            del self[key]
+
+
+class JsonBackend:
+    """Encodes and decodes JSON using the named module: 'orjson' or 'ujson' (optional, faster
+    third-party packages) or 'json' (standard library). Raises an ImportError if the module is
+    not installed.
+
+    < dumps > and < loads > accept the standard library's arguments. Formatting options that a
+    third-party backend does not support (e.g., orjson supports only two-space indentation and
+    cannot escape non-ASCII characters) and data that it rejects (e.g., non-string keys,
+    integers wider than 64 bits) are delegated to the standard library, so output is laid out
+    as the standard library would lay it out.
+
+    WARN: third-party backends may format floats differently (e.g., 1e16 rather than 1e+16) and
+    orjson writes NaN and Infinity as null. Select the 'json' backend if byte-for-byte
+    standard library output is required.
+
+    Parameters:
+        name (str): backend module name
+    """
+
+    def __init__(self, name='json'):
+        self.name = name
+        self.module = importlib.import_module(name)
+
+    def __repr__(self):
+        return f"JsonBackend({self.name!r})"
+
+    def dumps(self, data, ensure_ascii=False, indent=None, separators=None):
+        """Returns < data > encoded as a JSON string.
+
+        Parameters:
+            data (obj): value to encode
+            ensure_ascii (bool): if False non-ASCII characters are written as is; otherwise
+                                 non-ASCII characters are escaped
+            indent (int): number of "pretty printed" indention spaces (None: single line)
+            separators (tuple): optional (item, key) separators; pass
+                                < JSON_COMPACT_SEPARATORS > for the most compact output
+
+        Returns:
+            str: JSON text
+        """
+
+        compact = separators == JSON_COMPACT_SEPARATORS
+        pretty = indent is not None and separators in (None, (',', ': '))
+        try:
+            if self.name == 'orjson' and not ensure_ascii:
+                if pretty and indent == 2:
+                    return self.module.dumps(data, option=self.module.OPT_INDENT_2).decode()
+                if compact and indent is None:
+                    return self.module.dumps(data).decode()
+            elif self.name == 'ujson' and (pretty or (compact and indent is None)):
+                return self.module.dumps(
+                    data,
+                    ensure_ascii=ensure_ascii,
+                    indent=indent or 0,
+                    escape_forward_slashes=False
+                )
+        except (TypeError, ValueError, OverflowError):
+            pass # unsupported data (e.g., non-string keys or very large integers)
+        return json.dumps(data, ensure_ascii=ensure_ascii, indent=indent, separators=separators)
+
+    def loads(self, text):
+        """Returns the value decoded from the JSON < text >.
+
+        Parameters:
+            text (str|bytes): JSON text
+
+        Returns:
+            obj: decoded value
+        """
+
+        return self.module.loads(text)
+
+
+class JsonStreamReader:
+    """Incremental JSON tokenizer used by < stream_json_array > and < stream_json_object >. The
+    open text file < file_obj > is read in < buffer_size > character blocks; values are decoded
+    with json.JSONDecoder.raw_decode() as soon as they are complete and consumed text is
+    discarded whenever the buffer is refilled.
+
+    Elements are unbounded by default. If < max_element_size > is provided, an element still
+    incomplete once more than that many characters are buffered raises a json.JSONDecodeError
+    ("Element exceeds max_element_size ...") instead of reading further. Error positions
+    (< pos >, < lineno >, < colno >) refer to the file, not to the buffer; the error's < doc >
+    is the buffered text only.
+
+    Parameters:
+        file_obj (file): file opened in text mode
+        buffer_size (int): characters read per block
+        max_element_size (int): optional maximum size of a decoded element, in characters
+    """
+
+    def __init__(self, file_obj, buffer_size=JSON_BUFFER_SIZE, max_element_size=None):
+        self.file_obj = file_obj
+        self.buffer_size = buffer_size
+        self.max_element_size = max_element_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.offset = 0 # characters discarded from the start of the file
+        self.lineno = 1 # line number of the first buffered character
+        self.line_offset = 0 # file offset of the start of that line
+        self.eof = False
+
+    def accept(self, char):
+        """Consumes the next non-whitespace character if it is < char >.
+
+        Parameters:
+            char (str): expected character
+
+        Returns:
+            bool: True if < char > was consumed
+        """
+
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def decode(self):
+        """Decodes and returns the value that starts at the next non-whitespace character,
+        reading further blocks until the value is complete. A json.JSONDecodeError is raised if
+        the value is malformed or exceeds < max_element_size >.
+
+        Parameters:
+            None
+
+        Returns:
+            obj: decoded value
+        """
+
+        self.skip_whitespace()
+        if len(self.buffer) - self.pos < self.buffer_size and not self.eof:
+            self.fill()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                if self.eof:
+                    raise self.error(e.msg, e.pos) from None
+                if (self.max_element_size is not None
+                        and len(self.buffer) - self.pos > self.max_element_size):
+                    raise self.error(
+                        f"Element exceeds max_element_size of {self.max_element_size} characters"
+                    ) from None
+                self.fill() # value incomplete
+                continue
+            truncated = end == len(self.buffer) or (
+                isinstance(value, (int, float))
+                and self.buffer[end] not in JSON_WHITESPACE + ',]}')
+            if truncated and not self.eof:
+                self.fill() # a number may continue in the next block (e.g., "1" | ".5")
+                continue
+            self.pos = end
+            return value
+
+    def error(self, message, pos=None):
+        """Returns a json.JSONDecodeError for < message > at buffer position < pos > (default:
+        the current position), reporting the corresponding file position.
+        """
+
+        if pos is None:
+            pos = self.pos
+        error = json.JSONDecodeError(message, self.buffer, pos)
+        newlines = self.buffer.count('\n', 0, pos)
+        error.pos = self.offset + pos
+        error.lineno = self.lineno + newlines
+        if newlines:
+            error.colno = pos - self.buffer.rfind('\n', 0, pos)
+        else:
+            error.colno = error.pos - self.line_offset + 1
+        error.args = (f"{message}: line {error.lineno} column {error.colno} (char {error.pos})",)
+        return error
+
+    def expect(self, chars, message):
+        """Consumes and returns the next non-whitespace character, raising a
+        json.JSONDecodeError with < message > if it is not one of < chars >.
+
+        Parameters:
+            chars (str): acceptable characters
+            message (str): error message
+
+        Returns:
+            str: consumed character
+        """
+
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error(message)
+        self.pos += 1
+        return char
+
+    def expect_end(self):
+        """Raises a json.JSONDecodeError unless only whitespace remains."""
+
+        if self.peek():
+            raise self.error('Extra data')
+
+    def fill(self):
+        """Appends the next block to the buffer, discarding consumed text."""
+
+        block = self.file_obj.read(self.buffer_size)
+        self.eof = not block
+        newlines = self.buffer.count('\n', 0, self.pos)
+        if newlines:
+            self.lineno += newlines
+            self.line_offset = self.offset + self.buffer.rfind('\n', 0, self.pos) + 1
+        self.offset += self.pos
+        self.buffer = self.buffer[self.pos:] + block
+        self.pos = 0
+
+    def peek(self):
+        """Returns the next non-whitespace character without consuming it ('' at the end of
+        the file).
+        """
+
+        self.skip_whitespace()
+        return self.buffer[self.pos:self.pos + 1]
+
+    def skip_whitespace(self):
+        """Advances past whitespace, refilling the buffer as required."""
+
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in JSON_WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return
+            self.fill()
+
+
+class LRUCache:
+    """Bounded cache that evicts the least recently used entries once either < max_entries >
+    entries or < max_bytes > (approximate, measured as the length of each value's JSON
+    encoding) is exceeded. Entries may also expire: < ttls > maps a SWAPI category (e.g.,
+    'people', 'planets') to a time-to-live in seconds, with < default_ttl > applied to all other
+    categories. Hit, miss, eviction, and expiration counters are maintained for reporting via
+    < stats >.
+
+    Supports the subset of the dictionary interface used by the cache helpers (e.g.,
+    < get_swapi_resource >, < CacheWriter >), so it can be substituted for the plain dictionary
+    returned by < create_cache >.
+
+    Parameters:
+        max_entries (int): maximum number of entries; None for no limit
+        max_bytes (int): maximum approximate size of all entries; None for no limit
+        ttls (dict): optional per-category time-to-live values in seconds
+        default_ttl (float): optional time-to-live applied to categories absent from < ttls >
+    """
+
+    def __init__(self, max_entries=None, max_bytes=None, ttls=None, default_ttl=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttls = ttls if ttls else {}
+        self.default_ttl = default_ttl
+        self.entries = OrderedDict() # key -> (value, size, created_at, expires_at)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = threading.RLock()
+
+    def __contains__(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and not self._is_expired(entry)
+
+    def __delitem__(self, key):
+        with self.lock:
+            value, size, created_at, expires_at = self.entries.pop(key)
+            self.nbytes -= size
+
+    def __getitem__(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                raise KeyError(key)
+            if self._is_expired(entry):
+                del self[key]
+                self.expirations += 1
+                self.misses += 1
+                raise KeyError(key)
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def copy(self):
+        """Returns a plain dictionary of the unexpired entries (least recently used first).
+        Neither the hit/miss counters nor the recency order are affected.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: unexpired key-value pairs
+        """
+
+        with self.lock:
+            return {key: entry[0] for key, entry in self.entries.items()
+                    if not self._is_expired(entry)}
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        return list(self.copy().items())
+
+    def keys(self):
+        return list(self.copy().keys())
+
+    def peek(self, key):
+        """Returns the value of an unexpired entry and the time at which it was created
+        without affecting the hit/miss counters or the recency order. Raises a KeyError if
+        there is no such entry.
+
+        Parameters:
+            key (str): cache key
+
+        Returns:
+            tuple: value and epoch timestamp
+        """
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or self._is_expired(entry):
+                raise KeyError(key)
+            return entry[0], entry[2]
+
+    def set(self, key, value, created_at=None):
+        """Adds or replaces the entry for < key > and evicts least recently used entries until
+        the cache is back within its bounds. The entry's expiry is calculated from
+        < created_at > (defaults to now) plus the time-to-live of the key's category; an entry
+        that has already expired is discarded rather than added.
+
+        Parameters:
+            key (str): cache key
+            value (obj): value to cache
+            created_at (float): optional epoch timestamp at which the value was retrieved
+
+        Returns:
+            None
+        """
+
+        if created_at is None:
+            created_at = time.time()
+        ttl = self.ttls.get(get_cache_category(key), self.default_ttl)
+        expires_at = None if ttl is None else created_at + ttl
+        if expires_at is not None and expires_at <= time.time():
+            with self.lock:
+                if key in self.entries:
+                    del self[key]
+                self.expirations += 1
+            return None
+
+        size = len(get_json_backend().dumps(value, separators=JSON_COMPACT_SEPARATORS))
+        with self.lock:
+            if key in self.entries:
+                del self[key]
+            self.entries[key] = (value, size, created_at, expires_at)
+            self.nbytes += size
+            while self.entries and (
+                (self.max_entries is not None and len(self.entries) > self.max_entries)
+                or (self.max_bytes is not None and self.nbytes > self.max_bytes)):
+                oldest = next(iter(self.entries))
+                del self[oldest]
+                self.evictions += 1
+
+    def stats(self):
+        """Returns the cache counters and current size.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: hits, misses, evictions, expirations, entries, and bytes
+        """
+
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'entries': len(self.entries),
+                'bytes': self.nbytes
+            }
+
+    def values(self):
+        return list(self.copy().values())
+
+    def _is_expired(self, entry):
+        return entry[3] is not None and entry[3] <= time.time()
+
+
+class NameIndex:
+    """Name lookup over a list of records. Maps each normalized < key > value (see
+    < normalize_name >) to the list of records sharing that value, in their original order, so
+    each lookup is a single dictionary access rather than a scan. Approximate matching
+    (see < best >) is delegated to a < FuzzyNameIndex > built the first time it is needed.
+
+    The caller builds the index once per dataset and passes it to each lookup; the index holds
+    a reference to < records > only for as long as the caller keeps the index, and is not
+    updated if < records > changes afterwards.
+
+    Parameters:
+        records (list): nested dictionaries (e.g., Wookieepedia-sourced entities)
+        key (str): key whose value identifies a record
+    """
+
+    def __init__(self, records, key='name'):
+        self.records = records
+        self.key = key
+        self.fuzzy_index = None
+        self.index = {}
+        for record in records:
+            self.index.setdefault(normalize_name(record.get(key)), []).append(record)
+
+    def best(self, name):
+        """Returns the record whose name is closest to < name > (see < FuzzyNameIndex.best >),
+        or None if no record is within < FUZZY_MAX_DISTANCE > edits.
+
+        Parameters:
+            name (str): search term
+
+        Returns:
+            dict|None: closest matching record
+        """
+
+        if self.fuzzy_index is None:
+            self.fuzzy_index = FuzzyNameIndex(self.records, self.key)
+        return self.fuzzy_index.best(name)
+
+    def get(self, name, default=None):
+        """Returns the records whose normalized name equals that of < name >.
+
+        Parameters:
+            name (str): search term
+            default (obj): value returned if there is no match
+
+        Returns:
+            list: matching records in their original order; < default > if none match
+        """
+
+        return self.index.get(normalize_name(name), default)
+
+
+class RunningStats:
+    """Count, sum, mean, minimum, maximum, and variance of a stream of numbers, updated
+    incrementally as values are added or removed rather than recomputed from the full dataset.
+    Variance is maintained with Welford's algorithm; two instances (e.g., built from separate
+    batches of articles) are combined with < merge >.
+
+    A tally (< Counter >) of each distinct value is kept so that the minimum and maximum remain
+    correct when values are removed; memory therefore grows with the number of distinct values.
+    < add > runs in O(1) time, as does < remove > unless it removes the last occurrence of the
+    current minimum or maximum, which rescans the distinct values (O(d)). < merge > is O(d) in
+    the distinct values of the other instance. Statistics of an empty instance are None.
+
+    Parameters:
+        values (iterable): optional initial values
+    """
+
+    def __init__(self, values=()):
+        self.count = 0
+        self.total = 0
+        self.mean_ = 0.0 # running mean used by the variance update
+        self.m2 = 0.0 # sum of squared differences from the running mean
+        self.values = Counter()
+        self.min = None
+        self.max = None
+        for value in values:
+            self.add(value)
+
+    def __repr__(self):
+        return (f"RunningStats(count={self.count}, total={self.total}, mean={self.mean}, "
+                f"min={self.min}, max={self.max}, variance={self.variance})")
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    @property
+    def stdev(self):
+        variance = self.variance
+        return variance ** 0.5 if variance is not None else None
+
+    @property
+    def variance(self):
+        """Population variance (divide < m2 > by count - 1 for the sample variance)."""
+
+        return self.m2 / self.count if self.count else None
+
+    def add(self, value):
+        """Adds < value > to the statistics.
+
+        Parameters:
+            value (int|float): value to add
+
+        Returns:
+            None
+        """
+
+        self.count += 1
+        self.total += value
+        delta = value - self.mean_
+        self.mean_ += delta / self.count
+        self.m2 += delta * (value - self.mean_)
+        self.values[value] += 1
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Merges the statistics of < other > into this instance (Chan et al.'s parallel
+        variance update).
+
+        Parameters:
+            other (RunningStats): statistics to merge
+
+        Returns:
+            RunningStats: this instance
+        """
+
+        if not other.count:
+            return self
+        count = self.count + other.count
+        delta = other.mean_ - self.mean_
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean_ += delta * other.count / count
+        self.count = count
+        self.total += other.total
+        self.values.update(other.values)
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def remove(self, value):
+        """Removes a previously added < value > from the statistics. Raises a ValueError if
+        < value > was not added.
+
+        Parameters:
+            value (int|float): value to remove
+
+        Returns:
+            None
+        """
+
+        if not self.values[value]:
+            del self.values[value]
+            raise ValueError(f"{value} not in statistics")
+
+        self.values[value] -= 1
+        if not self.values[value]:
+            del self.values[value]
+        self.count -= 1
+        self.total -= value
+        if not self.count:
+            self.mean_ = self.m2 = 0.0
+            self.min = self.max = None
+            return
+
+        delta = value - self.mean_
+        self.mean_ -= delta / self.count
+        self.m2 = max(self.m2 - delta * (value - self.mean_), 0.0)
+        if value == self.min and value not in self.values:
+            self.min = min(self.values)
+        if value == self.max and value not in self.values:
+            self.max = max(self.values)
+
+
+class SearchIndex:
+    """In-process stand-in for SWAPI "search" queries against a prefetched category (see
+    < prefetch_category >). Like SWAPI, a search matches entities whose < field > value
+    contains the search term (case insensitive). Searchable values are casefolded once and
+    concatenated into a single string so that a search is a handful of < str.find > calls
+    rather than a loop over every entity; results are memoized per term.
+
+    Parameters:
+        entities (list): dictionary representations of SWAPI entities
+        field (str): searchable key (e.g., 'name', 'title')
+    """
+
+    def __init__(self, entities, field='name'):
+        self.entities = list(entities)
+        self.field = field
+        self.offsets = []
+        values = []
+        offset = 0
+        for entity in self.entities:
+            value = str(entity.get(field) or '').casefold()
+            self.offsets.append(offset)
+            values.append(value)
+            offset += len(value) + 1
+        self.values = '\n'.join(values)
+        self.memo = {}
+
+    def __len__(self):
+        return len(self.entities)
+
+    def envelope(self, term):
+        """Returns the search results for < term > wrapped in a SWAPI-style envelope.
+
+        Parameters:
+            term (str): search term
+
+        Returns:
+            dict: envelope with "count", "next", "previous", and "results" keys
+        """
+
+        results = self.search(term)
+        return {'count': len(results), 'next': None, 'previous': None, 'results': results}
+
+    def search(self, term):
+        """Returns the entities whose < field > value contains < term > (case insensitive), in
+        prefetch order.
+
+        Parameters:
+            term (str): search term
+
+        Returns:
+            list: matching entities
+        """
+
+        term = str(term).casefold()
+        results = self.memo.get(term)
+        if results is None:
+            matches = []
+            start = -1 if '\n' in term else self.values.find(term) # '\n' separates values
+            while start != -1:
+                i = bisect.bisect_right(self.offsets, start) - 1
+                matches.append(i)
+                if i + 1 == len(self.offsets):
+                    break
+                start = self.values.find(term, self.offsets[i + 1]) # resume at next value
+            results = self.memo[term] = tuple(self.entities[i] for i in matches)
+        return list(results)
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key. The first caller for a key (the "leader")
+    executes the call; callers arriving with the same key while the call is in flight wait for
+    and share the leader's result (or exception) rather than repeating the work.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+
+    def do(self, key, func, *args, **kwargs):
+        """Calls < func > with the passed in arguments unless a call for < key > is already in
+        flight, in which case waits for that call to complete and returns its result.
+
+        Parameters:
+            key (str): identifies the call (e.g., a cache key)
+            func (function): function to call
+            args (tuple): positional arguments passed to < func >
+            kwargs (dict): keyword arguments passed to < func >
+
+        Returns:
+            any: return value of < func >
+        """
+
+        with self.lock:
+            call = self.calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.calls[key] = {'done': threading.Event(), 'result': None, 'error': None}
+
+        if not leader:
+            call['done'].wait()
+            if call['error'] is not None:
+                raise call['error']
+            return call['result']
+
+        try:
+            call['result'] = func(*args, **kwargs)
+            return call['result']
+        except BaseException as error:
+            call['error'] = error
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call['done'].set()
+
+
+# In-flight remote requests, keyed by cache key (see get_cached_resource)
+in_flight = SingleFlight()
+
+
+class SQLiteCache:
+    """On-disk cache backed by a SQLite database. Entries are keyed by < create_cache_key >
+    output and stored as JSON text in a table whose primary key provides indexed point lookups,
+    so opening the cache costs the same regardless of its size and each lookup decodes only the
+    entry requested. Values are returned frozen (see < freeze >).
+
+    New entries are held in memory until < persist > writes them in a single transaction
+    (pair the cache with a < CacheWriter > to batch writes automatically). The database runs in
+    write-ahead logging (WAL) mode, permitting several worker processes to read and write the
+    same cache file concurrently.
+
+    Parameters:
+        filepath (str): path to the SQLite database file
+        timeout (float): seconds to wait for a lock held by another process
+    """
+
+    def __init__(self, filepath, timeout=30.0):
+        self.filepath = filepath
+        self.pending = {}
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(filepath, timeout=timeout, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS cache '
+            '(key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL) WITHOUT ROWID'
+        )
+        self.connection.commit()
+
+    def __contains__(self, key):
+        with self.lock:
+            if key in self.pending:
+                return True
+            row = self.connection.execute('SELECT 1 FROM cache WHERE key = ?', (key,)).fetchone()
+            return row is not None
+
+    def __delitem__(self, key):
+        with self.lock:
+            pending = self.pending.pop(key, None)
+            cursor = self.connection.execute('DELETE FROM cache WHERE key = ?', (key,))
+            self.connection.commit()
+            if pending is None and not cursor.rowcount:
+                raise KeyError(key)
+
+    def __getitem__(self, key):
+        with self.lock:
+            if key in self.pending:
+                return self.pending[key]
+            row = self.connection.execute(
+                'SELECT value FROM cache WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        return freeze(get_json_backend().loads(row[0]))
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        with self.lock:
+            count = self.connection.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+            new = [key for key in self.pending if key not in self._stored_keys(self.pending)]
+            return count + len(new)
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.pending[key] = freeze(value)
+
+    def close(self):
+        """Persists any pending entries and closes the database connection.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            self.persist()
+            self.connection.close()
+
+    def copy(self):
+        """Returns a plain dictionary of every entry. Decodes the entire cache; intended for
+        exports only.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: key-value pairs
+        """
+
+        return dict(self.items())
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        self.persist()
+        with self.lock:
+            rows = self.connection.execute('SELECT key, value FROM cache').fetchall()
+        backend = get_json_backend()
+        return [(key, freeze(backend.loads(value))) for key, value in rows]
+
+    def keys(self):
+        self.persist()
+        with self.lock:
+            return [row[0] for row in self.connection.execute('SELECT key FROM cache')]
+
+    def persist(self, keys=None):
+        """Writes pending entries to the database in a single transaction. If < keys > is
+        provided only those pending entries are written.
+
+        Parameters:
+            keys (iterable): optional subset of pending keys to write
+
+        Returns:
+            None
+        """
+
+        with self.lock:
+            if keys is None:
+                keys = list(self.pending)
+            entries = {key: self.pending.pop(key) for key in keys if key in self.pending}
+            self.set_many(entries)
+
+    def set_many(self, entries):
+        """Inserts or replaces the passed in < entries > in a single transaction.
+
+        Parameters:
+            entries (dict): key-value pairs to store
+
+        Returns:
+            None
+        """
+
+        if not entries:
+            return None
+        created_at = time.time()
+        backend = get_json_backend()
+        rows = [(key, backend.dumps(value, separators=JSON_COMPACT_SEPARATORS), created_at)
+                for key, value in entries.items()]
+        with self.lock, self.connection:
+            self.connection.executemany(
+                'INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)', rows)
+
+    def values(self):
+        return [value for key, value in self.items()]
+
+    def _stored_keys(self, keys):
+        stored = set()
+        keys = list(keys)
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            query = f"SELECT key FROM cache WHERE key IN ({','.join('?' * len(chunk))})"
+            stored.update(row[0] for row in self.connection.execute(query, chunk))
+        return stored
+
+
+@functools.lru_cache(maxsize=CACHE_KEY_MEMO_SIZE)
+def canonicalize_cache_key(url, params=()):
+    """Returns the canonical cache key for the passed in < url > and < params > (see
+    < create_cache_key >). Querystring fields embedded in < url > (e.g., in a "next" link) are
+    merged with < params >. Results are memoized, so repeated (url, params) pairs cost a
+    single dictionary probe.
+
+    Parameters:
+        url (str): string representing a Uniform Resource Locator (URL)
+        params (tuple): sorted (field, value) string pairs
+
+    Returns:
+        str: canonical lowercase cache key
+    """
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path if parts.path.endswith('/') else f"{parts.path}/"
+
+    fields = sorted(set(parse_qsl(parts.query, keep_blank_values=True)) | set(params))
+    fields = [(key, val) for key, val in fields if (key.lower(), val) != ('page', '1')]
+    if fields:
+        return f"{scheme}://{host}{path}?{urlencode(fields, quote_via=quote)}".lower()
+    else:
+        return f"{scheme}://{host}{path}".lower()
+
+
+def chunk(items, size):
+    """Yields lists of up to < size > consecutive items drawn from the passed in < items >
+    iterable (the last list may be shorter). Only one list is held in memory at a time, so
+    < chunk > may be combined with the streaming readers (e.g., < stream_csv_to_dicts >) to
+    process a large file in fixed-size batches.
+
+    Parameters:
+        items (iterable): items to batch
+        size (int): maximum number of items per batch
+
+    Returns:
+        generator: lists of items
+    """
+
+    if size < 1:
+        raise ValueError(f"Chunk size must be a positive integer: {size}")
+
+    items = iter(items)
+    while True:
+        batch = list(itertools.islice(items, size))
+        if not batch:
+            return
+        yield batch
+
+
+def compile_record_converter(fields, normalize='source'):
+    """Compiles a declarative field map into a function that converts a source dictionary
+    (e.g., a SWAPI or Wookieepedia record) into a new "thinned" dictionary in a single pass.
+
+    Each item in < fields > is a tuple structured in one of the following ways:
+
+    (< target key >, < source key >)
+    (< target key >, < source key >, < converter >)
+    (< target key >, < nested fields >)
+
+    A < converter > (e.g., < convert_to_int >) is called with the source value. Nested fields
+    (a tuple of field tuples) produce a nested dictionary drawn from the same source record.
+    Target keys are added in the order listed.
+
+    Values that are members of < NONE_VALUES > are converted to None as each field is read
+    rather than in separate passes over the record. The < normalize > argument determines when:
+
+    'source': before the converter is called (as if < convert_none_values > had first been
+              called on the source record)
+    'target': after the converter is called (as if < convert_none_values > had been called on
+              the new dictionary and each nested dictionary)
+    None: values are not converted
+
+    The field map is resolved once; the returned function performs no per-field dispatch
+    beyond calling each field's accessor.
+
+    Parameters:
+        fields (tuple): field tuples as described above
+        normalize (str): 'source', 'target', or None
+
+    Returns:
+        function: converter that accepts a source dictionary and returns a new dictionary
+    """
+
+    if normalize not in ('source', 'target', None):
+        raise ValueError(f"Unsupported normalize value: {normalize}")
+
+    def to_none(value):
+        if isinstance(value, str) and value.strip().lower() in NONE_VALUES:
+            return None
+        return value
+
+    def compile_field(source, converter):
+        if converter is None:
+            if normalize is None:
+                return lambda data: data.get(source)
+            return lambda data: to_none(data.get(source))
+        if normalize == 'source':
+            return lambda data: converter(to_none(data.get(source)))
+        if normalize == 'target':
+            return lambda data: to_none(converter(data.get(source)))
+        return lambda data: converter(data.get(source))
+
+    def compile_fields(fields):
+        accessors = []
+        for field in fields:
+            target, source, converter = (tuple(field) + (None,))[:3]
+            if isinstance(source, (tuple, list)):
+                accessors.append((target, compile_fields(source)))
+            else:
+                accessors.append((target, compile_field(source, converter)))
+        accessors = tuple(accessors)
+        return lambda data: {target: accessor(data) for target, accessor in accessors}
+
+    return compile_fields(fields)
+
+
+def configure_json_backend(name=None):
+    """Replaces the shared JSON backend returned by < get_json_backend >. If < name > is None
+    the fastest installed backend listed in < JSON_BACKENDS > is selected.
+
+    Parameters:
+        name (str): optional backend module name ('orjson', 'ujson', or 'json')
+
+    Returns:
+        JsonBackend: new shared backend
+    """
+
+    global json_backend
+    if name:
+        json_backend = JsonBackend(name)
+        return json_backend
+    for backend in JSON_BACKENDS:
+        try:
+            json_backend = JsonBackend(backend)
+            return json_backend
+        except ImportError:
+            continue
+    json_backend = JsonBackend('json')
+    return json_backend
+
+
+def configure_session(**kwargs):
+    """Replaces the shared HTTP session returned by < get_session > with a new session
+    configured per the passed in keyword arguments (see < create_session >). The previous
+    session's connections are closed.
+
+    Parameters:
+        kwargs (dict): keyword arguments passed to < create_session >
+
+    Returns:
+        requests.Session: new shared session
+    """
+
+    global session, session_kwargs
+    with session_lock:
+        if session is not None:
+            session.close()
+        session = create_session(**kwargs)
+        session_kwargs = kwargs
+        return session
 
 
 def convert_gravity_value(value):
@@ -211,30 +2104,73 @@ def convert_to_year_era(value):
         return value
 
 
-def create_cache(filepath):
+def create_cache(filepath, max_entries=None, max_bytes=None, ttls=None):
     """Attempts to retrieve cache contents written to the file system. If successful the
     cache contents from the previous script run are returned to the caller as the new
     cache. If unsuccessful an empty cache is returned to the caller.
 
+    If any of < max_entries >, < max_bytes >, or < ttls > is provided the contents are loaded
+    into a bounded < LRUCache > rather than a plain dictionary. The file is streamed one entry
+    at a time (see < stream_json_object >) and the bounds are applied as entries are loaded, so
+    only the most recently written entries are kept in memory and the rest remain on disk.
+    Loaded entries are frozen and their expiry is calculated from each entry's stored creation
+    time; expired entries are skipped (see < unpack_cache_entry >). Entries still in the
+    < CacheWriter > journal (e.g., after a crash) are replayed after the file is loaded.
+
+    If < filepath > ends with one of the < SQLITE_CACHE_EXTENSIONS > an on-disk < SQLiteCache >
+    is opened instead; nothing is loaded up front and the bounds are not applied. Likewise, if
+    < filepath > ends with one of the < COMPRESSED_CACHE_EXTENSIONS > a < CompressedCache > is
+    opened, reading its index only.
+
     Parameters:
         filepath (str): path to the cache file
+        max_entries (int): optional maximum number of cache entries
+        max_bytes (int): optional maximum approximate cache size in bytes
+        ttls (dict): optional per-category time-to-live values in seconds
 
     Returns:
-        dict: cache either empty or populated with resources from the previous script run
+        dict|LRUCache|SQLiteCache|CompressedCache: cache either empty or populated with
+                                                   resources from the previous script run
     """
 
+    if filepath.lower().endswith(SQLITE_CACHE_EXTENSIONS):
+        return SQLiteCache(filepath)
+    extension = os.path.splitext(filepath)[1].lower()
+    if extension in COMPRESSED_CACHE_EXTENSIONS:
+        return CompressedCache(filepath, COMPRESSED_CACHE_EXTENSIONS[extension])
+
+    if max_entries is None and max_bytes is None and not ttls:
+        cache = {}
+    else:
+        cache = LRUCache(max_entries, max_bytes, ttls)
+
+    def load(entries, file_created_at=None):
+        for key, entry in entries:
+            value, created_at = unpack_cache_entry(entry, file_created_at)
+            if isinstance(cache, LRUCache):
+                cache.set(key, freeze(value), created_at)
+            else:
+                cache[key] = value
+
     try:
-        return read_json(filepath)
+        load(stream_json_object(filepath), os.path.getmtime(filepath))
     except FileNotFoundError:
-        return {}
+        pass
+    load(stream_cache_journal(filepath + CACHE_JOURNAL_SUFFIX)) # unflushed by compaction
+    return cache
 
 
 def create_cache_key(url, params=None):
     """Returns a lowercase string key comprising the passed in < url >, and, if < params >
     is not None, the "?" separator, and any URL encoded querystring fields and values.
-    Passes to the function < urllib.parse.urljoin > the optional < quote_via=quote >
-    argument to override the default behavior and encode spaces with '%20' rather
-    than "+".
+    The querystring is encoded with < quote > so that spaces are encoded as '%20' rather than
+    "+".
+
+    Keys are canonical: querystring fields are sorted, the scheme and host are lowercased
+    and default ports dropped, a trailing slash is appended to the path, and the default
+    "page=1" pagination field is removed. Equivalent requests therefore share a single cache
+    entry regardless of parameter order or URL spelling. Delegates to the memoized function
+    < canonicalize_cache_key > the task of building the key.
 
     Example:
        url = https://swapi.py4e.com/api/people/
@@ -250,89 +2186,1129 @@ def create_cache_key(url, params=None):
     """
 
     if params:
-        return urljoin(url, f"?{urlencode(params, quote_via=quote)}").lower() # space replaced with '%20'
+        fields = tuple(sorted((str(key), str(val)) for key, val in params.items()))
+        return canonicalize_cache_key(url, fields)
     else:
-        return url.lower()
+        return canonicalize_cache_key(url)
 
 
-def get_resource(url, params=None, timeout=10):
-    """Returns a response object decoded into a dictionary. If query string < params > are
-    provided the response object body is returned in the form on an "envelope" with the data
-    payload of one or more entities to be found in ['results'] list; otherwise, response
-    object body is returned as a single dictionary representation of the entity.
+def create_session(pool_size=HTTP_POOL_SIZE, host_pool_sizes=None, retries=0,
+                   backoff_factor=HTTP_BACKOFF_FACTOR, status_forcelist=HTTP_RETRY_STATUSES):
+    """Returns a new < requests.Session > whose transport adapters keep up to < pool_size >
+    keep-alive connections open per host. Hosts listed in < host_pool_sizes > are mounted with
+    their own adapter and pool size. Failed GET requests (connection errors and responses
+    whose status code is in < status_forcelist >) are retried up to < retries > times with
+    exponential backoff.
+
+    WARN: Transport-level retries are disabled by default; < get_resource > retries requests
+    itself so that retries respect its deadline and the host's circuit breaker.
+
+    Parameters:
+        pool_size (int): connections kept alive per host
+        host_pool_sizes (dict): optional host name to pool size overrides
+        retries (int): maximum number of retries per request
+        backoff_factor (float): backoff factor applied between retries
+        status_forcelist (tuple): HTTP status codes that trigger a retry
+
+    Returns:
+        requests.Session: configured session; its < pool_size > attribute records the smallest
+                          pool size mounted
+    """
+
+    if host_pool_sizes is None:
+        host_pool_sizes = HTTP_HOST_POOL_SIZES
+
+    def create_adapter(size):
+        retry = Retry(total=retries, backoff_factor=backoff_factor,
+                      status_forcelist=status_forcelist, allowed_methods=('GET',),
+                      raise_on_status=False)
+        return HTTPAdapter(pool_connections=size, pool_maxsize=size, max_retries=retry)
+
+    new_session = requests.Session()
+    new_session.mount('https://', create_adapter(pool_size))
+    new_session.mount('http://', create_adapter(pool_size))
+    for host, size in host_pool_sizes.items():
+        adapter = create_adapter(size)
+        new_session.mount(f"https://{host}/", adapter)
+        new_session.mount(f"http://{host}/", adapter)
+    new_session.pool_size = min([pool_size, *host_pool_sizes.values()])
+    return new_session
+
+
+def fetch_resource(cache, key, url, params=None, timeout=HTTP_TIMEOUT, writer=None):
+    """Retrieves a resource from a remote API by delegating to < get_resource >, freezes it, and
+    adds it to the passed in < cache > under < key >. If another caller added the entry while
+    this call was waiting to run, the cached entry is returned instead. If a < writer > is
+    provided the new key is reported to it for persistence.
+
+    Responses that report that nothing was found (see < is_not_found >) are not cached.
+    Instead the key is recorded in the < negative_cache > for < NEGATIVE_CACHE_TTL > seconds
+    and None is returned.
 
     Parameters:
+        cache (dict|LRUCache|SQLiteCache): resource cache
+        key (str): cache key minted by < create_cache_key >
         url (str): a uniform resource locator that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
         timeout (int): timeout value in seconds
+        writer (CacheWriter): optional write-behind writer notified of new entries
 
     Returns:
-        dict: dictionary representation of the decoded JSON.
+        FrozenDict|tuple|None: frozen resource; None if the resource was not found
     """
 
-    if params:
-        return requests.get(url, params, timeout=timeout).json()
-    else:
-        return requests.get(url, timeout=timeout).json()
+    if key in cache:
+        return freeze(cache[key])
 
+    resource = freeze(get_resource(url, params, timeout))
+    if is_not_found(resource):
+        negative_cache[key] = time.monotonic() + NEGATIVE_CACHE_TTL
+        return None
+    cache[key] = resource
+    if writer:
+        writer.mark_dirty(key)
+    return resource
 
-def read_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=','):
-    """Accepts a file path, creates a file object, and returns a list of dictionaries that
-    represent the row values using the cvs.DictReader().
 
-    WARN: This function must be implemented using a list comprehension in order to earn points.
+@functools.lru_cache(maxsize=NAME_KEY_MEMO_SIZE)
+def fold_name(name):
+    """Returns the passed in < name > folded for approximate matching: Unicode compatibility
+    normalized, stripped of accents and other combining marks, casefolded, and with runs of
+    whitespace collapsed to a single space. Results are memoized.
+
+    Example:
+        'Padmé  Amidala' returns 'padme amidala'
 
     Parameters:
-        filepath (str): path to file
-        encoding (str): name of encoding used to decode the file
-        newline (str): specifies replacement value for newline '\n'
-                       or '\r\n' (Windows) character sequences
-        delimiter (str): delimiter that separates the row values
+        name (str): entity name
 
     Returns:
-        list: nested dictionaries representing the file contents
-     """
+        str: folded name ('' if < name > is not a string)
+    """
 
-    with open(filepath, 'r', newline=newline, encoding=encoding) as file_obj:
-        # data = []
-        reader = csv.DictReader(file_obj, delimiter=delimiter)
-        return [line for line in reader]
-        # for line in reader:
-        #     data.append(line) # OrderedDict() | alternative: data.append(dict(line))
+    if not isinstance(name, str):
+        return ''
+    decomposed = unicodedata.normalize('NFKD', name)
+    stripped = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(stripped.casefold().split())
 
-       
 
+def freeze(value):
+    """Returns a read-only copy of the passed in < value >. Dictionaries are converted to
+    < FrozenDict > and lists to tuples, recursively. Values that are already frozen are returned
+    unchanged, so freezing a cache value a second time costs nothing.
 
-def read_json(filepath, encoding='utf-8'):
-    """Reads a JSON document, decodes the file content, and returns a list or dictionary if
-    provided with a valid filepath.
+    Parameters:
+        value (obj): decoded JSON value
+
+    Returns:
+        FrozenDict|tuple|any: read-only representation of the value
+    """
+
+    if isinstance(value, FrozenDict):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(val) for key, val in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(val) for val in value)
+    return value
+
+
+def get_cache_category(key):
+    """Returns the SWAPI category (e.g., 'people', 'planets') of the resource identified by
+    the passed in cache < key >, i.e., the first path segment following "/api/".
 
     Parameters:
-        filepath (str): path to file
-        encoding (str): name of encoding used to decode the file
+        key (str): cache key or SWAPI URL
 
     Returns:
-        dict/list: dict or list representations of the decoded JSON document
+        str|None: category name if one can be determined; otherwise None
     """
 
-    with open(filepath, 'r', encoding=encoding) as file_obj:
-        return json.load(file_obj)
+    segments = [segment for segment in urlparse(key).path.split('/') if segment]
+    if 'api' in segments and segments.index('api') + 1 < len(segments):
+        return segments[segments.index('api') + 1]
+    return None
+
+
+def get_cached_resource(cache, url, params=None, timeout=HTTP_TIMEOUT, writer=None,
+                        mode=CACHE_VALUE_MODE):
+    """Retrieves a resource from either the passed in < cache > or, if no local copy exists,
+    from a remote API by delegating to < get_resource >. Remote resources are frozen (see
+    < freeze >) and added to the cache under the key minted by < create_cache_key >; if a
+    < writer > (e.g., < CacheWriter >) is provided the new key is reported to it for
+    persistence. The resource is returned shaped per < mode > (see < share >).
 
+    "search" queries against a category prefetched by < prefetch_category > are answered from
+    its < SearchIndex > without consulting the cache or the network.
 
-def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2):
-    """Serializes object as JSON. Writes content to the provided filepath.
+    Concurrent misses for the same key are coalesced by < in_flight >: only the first caller
+    issues the remote request, later callers wait for and share its result.
+
+    If the resource was not found (e.g., a "search" matched nothing or SWAPI responded "Not
+    found") None is returned. Misses are remembered in the < negative_cache > for
+    < NEGATIVE_CACHE_TTL > seconds, so repeating the lookup costs a dictionary probe.
 
     Parameters:
-        filepath (str): the path to the file
-        data (dict)/(list): the data to be encoded as JSON and written to the file
-        encoding (str): name of encoding used to encode the file
-        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
-                            non-ASCII characters are escaped.
-        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+        cache (dict|LRUCache|SQLiteCache): resource cache
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+        writer (CacheWriter): optional write-behind writer notified of new entries
+        mode (str): one of 'copy', 'cow', or 'frozen'
 
     Returns:
-        None
+        dict|list|None: requested resource sourced from either the cache or a remote API;
+                        None if the resource was not found
+    """
+
+    if params and list(params) == ['search']:
+        index = search_indexes.get(create_cache_key(url))
+        if index is not None:
+            envelope = index.envelope(params['search'])
+            return share(freeze(envelope), mode) if envelope['count'] else None
+
+    key = create_cache_key(url, params)
+    expires_at = negative_cache.get(key)
+    if expires_at is not None:
+        if expires_at > time.monotonic():
+            return None
+        negative_cache.pop(key, None)
+
+    resource = cache.get(key)
+    if resource is not None:
+        frozen = freeze(resource)
+        if frozen is not resource:
+            cache[key] = frozen # entries read from file are frozen once
+            resource = frozen
+    else:
+        resource = in_flight.do(key, fetch_resource, cache, key, url, params, timeout, writer)
+
+    if resource is None:
+        return None
+    return share(resource, mode)
+
+
+def get_circuit_breaker(host):
+    """Returns the < CircuitBreaker > guarding requests to the passed in < host >, creating it
+    on first use.
+
+    Parameters:
+        host (str): host name (and port, if any)
+
+    Returns:
+        CircuitBreaker: the host's circuit breaker
     """
 
+    with circuit_breakers_lock:
+        breaker = circuit_breakers.get(host)
+        if breaker is None:
+            breaker = circuit_breakers[host] = CircuitBreaker()
+        return breaker
+
+
+def get_cow_view(value):
+    """Returns a copy-on-write view of a frozen cache < value >: a < CopyOnWriteDict > for a
+    < FrozenDict >, a < CopyOnWriteList > for a tuple; any other value is returned as is.
+
+    Parameters:
+        value (obj): frozen cache value
+
+    Returns:
+        obj: copy-on-write view or < value >
+    """
+
+    if isinstance(value, FrozenDict):
+        return CopyOnWriteDict(value)
+    if isinstance(value, tuple):
+        return CopyOnWriteList(value)
+    return value
+
+
+def get_edit_distance(a, b, max_distance=None):
+    """Returns the Levenshtein (edit) distance between strings < a > and < b >: the minimum
+    number of single character insertions, deletions, and substitutions required to turn
+    one into the other. If < max_distance > is provided the calculation stops as soon as the
+    distance is known to exceed it and None is returned.
+
+    Parameters:
+        a (str): first string
+        b (str): second string
+        max_distance (int): optional bound on the distance
+
+    Returns:
+        int|None: edit distance; None if it exceeds < max_distance >
+    """
+
+    if len(a) < len(b):
+        a, b = b, a
+    if max_distance is not None and len(a) - len(b) > max_distance:
+        return None
+
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1, # deletion
+                current[j - 1] + 1, # insertion
+                previous[j - 1] + (char_a != char_b) # substitution
+            ))
+        if max_distance is not None and min(current) > max_distance:
+            return None
+        previous = current
+
+    distance = previous[-1]
+    if max_distance is not None and distance > max_distance:
+        return None
+    return distance
+
+
+def get_first_result(envelope):
+    """Returns the first entity in the "results" list of the passed in SWAPI < envelope >. If the
+    envelope is None (i.e., not found) or its "results" list is empty None is returned.
+
+    Parameters:
+        envelope (dict|None): SWAPI response envelope
+
+    Returns:
+        dict|None: first entity if one exists; otherwise None
+    """
+
+    if envelope and envelope.get('results'):
+        return envelope['results'][0]
+    return None
+
+
+def get_json_backend():
+    """Returns the shared JSON backend, selecting it on first use (see
+    < configure_json_backend >). The JSON_BACKEND environment variable, if set, names the
+    backend; otherwise the fastest installed backend is used.
+
+    Parameters:
+        None
+
+    Returns:
+        JsonBackend: shared backend
+    """
+
+    if json_backend is None:
+        configure_json_backend(JSON_BACKEND)
+    return json_backend
+
+
+def get_resource(url, params=None, timeout=HTTP_TIMEOUT, retries=HTTP_RETRIES,
+                 deadline=HTTP_DEADLINE):
+    """Returns a response object decoded into a dictionary. If query string < params > are
+    provided the response object body is returned in the form on an "envelope" with the data
+    payload of one or more entities to be found in ['results'] list; otherwise, response
+    object body is returned as a single dictionary representation of the entity.
+
+    The request is issued via the shared pooled session returned by < get_session > so that
+    keep-alive connections are reused across calls.
+
+    Failed requests (connection errors, timeouts, undecodable bodies, and responses whose
+    status code is in < HTTP_RETRY_STATUSES >) are retried up to < retries > times. Retries
+    wait a random interval of up to < HTTP_BACKOFF_FACTOR > * 2 ** (attempt - 1) seconds
+    (capped at < HTTP_BACKOFF_MAX >). No attempt or wait may exceed the overall < deadline >.
+    Each host is guarded by a circuit breaker (see < get_circuit_breaker >); while the circuit
+    is open requests fail fast with a < CircuitOpenError >. Every request the breaker allows is
+    recorded as a success or a failure, whatever exception is raised, so a half-open trial
+    request always settles the circuit.
+
+    Parameters:
+        url (str): a uniform resource locator that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds
+        retries (int): maximum number of retries
+        deadline (float): total seconds allowed for the request, retries included
+
+    Returns:
+        dict: dictionary representation of the decoded JSON.
+    """
+
+    host = urlparse(url).netloc.lower()
+    breaker = get_circuit_breaker(host)
+    expires_at = time.monotonic() + deadline
+    attempt = 0
+    while True:
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Deadline of {deadline} seconds exceeded requesting {url}")
+        if not breaker.allow(): # may claim the half-open trial; settled by record_*() below
+            raise CircuitOpenError(f"Circuit open for {host}; request to {url} not sent")
+
+        try:
+            if params:
+                response = get_session().get(url, params=params, timeout=min(timeout, remaining))
+            else:
+                response = get_session().get(url, timeout=min(timeout, remaining))
+            if response.status_code in HTTP_RETRY_STATUSES:
+                raise requests.HTTPError(f"{response.status_code} response", response=response)
+            data = response.json()
+        except (requests.RequestException, ValueError):
+            breaker.record_failure()
+            attempt += 1
+            backoff = min(HTTP_BACKOFF_MAX, HTTP_BACKOFF_FACTOR * 2 ** (attempt - 1))
+            delay = random.uniform(0, backoff) # "full jitter"
+            if attempt > retries or time.monotonic() + delay >= expires_at:
+                raise
+            time.sleep(delay)
+        except BaseException:
+            breaker.record_failure() # e.g., KeyboardInterrupt; never leave a trial pending
+            raise
+        else:
+            breaker.record_success()
+            return data
+
+
+def get_session(min_pool_size=None):
+    """Returns the shared HTTP session, creating it with the module's HTTP_* defaults on first
+    use. Call < configure_session > to replace it with a differently configured session.
+
+    If < min_pool_size > is provided and the session keeps fewer connections alive per host
+    (e.g., < resolve_urls > issuing < concurrency > requests at once), the session is replaced
+    with one whose pools are at least that large; its other settings are retained. Otherwise
+    connections beyond the pool size would be discarded and re-opened on every request.
+
+    Parameters:
+        min_pool_size (int): optional minimum number of connections kept alive per host
+
+    Returns:
+        requests.Session: shared session
+    """
+
+    global session
+    with session_lock:
+        if session is None or (min_pool_size and session.pool_size < min_pool_size):
+            kwargs = dict(session_kwargs)
+            if min_pool_size:
+                host_pool_sizes = kwargs.get('host_pool_sizes')
+                if host_pool_sizes is None:
+                    host_pool_sizes = HTTP_HOST_POOL_SIZES
+                kwargs['pool_size'] = max(kwargs.get('pool_size', HTTP_POOL_SIZE), min_pool_size)
+                kwargs['host_pool_sizes'] = {
+                    host: max(size, min_pool_size) for host, size in host_pool_sizes.items()}
+            if session is not None:
+                session.close()
+            session = create_session(**kwargs)
+        return session
+
+
+def get_trigrams(name):
+    """Returns the character trigrams of the passed in < name >, padded with two leading spaces
+    and one trailing space so that short names and word boundaries yield trigrams.
+
+    Example:
+        'r2' returns ['  r', ' r2', 'r2 ']
+
+    Parameters:
+        name (str): folded name
+
+    Returns:
+        list: trigrams
+    """
+
+    padded = f"  {name} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def get_urls(value):
+    """Returns the URLs held by the passed in < value >, which may be a single URL string, a
+    list of URL strings, or any other value (in which case an empty list is returned).
+
+    Parameters:
+        value (obj): entity value
+
+    Returns:
+        list: URL strings
+    """
+
+    if isinstance(value, (list, tuple)):
+        return [url for url in value if is_url(url)]
+    if is_url(value):
+        return [value]
+    return []
+
+
+def group_by(items, key, transform=None):
+    """Groups the passed in < items > in a single pass. The < key > function is called once
+    per item and returns the item's group key; items for which it returns None are skipped. If a
+    < transform > function is provided each item is transformed before it is added to its group.
+
+    Groups are ordered by the first appearance of their key and each group retains the original
+    order of its items. < items > may be any iterable (e.g., a generator).
+
+    Parameters:
+        items (iterable): items to group
+        key (function): returns the group key of an item (or None to skip the item)
+        transform (function): optional function applied to each grouped item
+
+    Returns:
+        dict: group key-list of items pairs
+    """
+
+    groups = {}
+    for item in items:
+        group_key = key(item)
+        if group_key is None:
+            continue
+        value = transform(item) if transform else item
+        group = groups.get(group_key)
+        if group is None:
+            groups[group_key] = [value]
+        else:
+            group.append(value)
+    return groups
+
+
+def is_not_found(resource):
+    """Returns True if the passed in SWAPI < resource > reports that nothing was found: an
+    empty "search" envelope (count of 0) or an error body such as {'detail': 'Not found'}.
+
+    Parameters:
+        resource (dict|list): decoded SWAPI response
+
+    Returns:
+        bool: True if nothing was found; otherwise False
+    """
+
+    if not resource:
+        return True
+    if isinstance(resource, dict):
+        if 'results' in resource:
+            return not resource['results']
+        return list(resource) == ['detail']
+    return False
+
+
+def is_url(value):
+    """Returns True if the passed in < value > is an HTTP(S) URL string; otherwise False.
+
+    Parameters:
+        value (obj): value to check
+
+    Returns:
+        bool: True if value is a URL
+    """
+
+    return isinstance(value, str) and value.startswith(('https://', 'http://'))
+
+
+@functools.lru_cache(maxsize=NAME_KEY_MEMO_SIZE)
+def normalize_name(name):
+    """Returns the casefolded form of the passed in < name > used for case-insensitive name
+    matching. Results are memoized.
+
+    Parameters:
+        name (str): entity name
+
+    Returns:
+        str|any: casefolded name; non-string values are returned unchanged
+    """
+
+    return name.casefold() if isinstance(name, str) else name
+
+
+def prefetch_category(url, cache, writer=None, timeout=HTTP_TIMEOUT):
+    """Retrieves every entity in a SWAPI category (e.g., < SWAPI_PLANETS >) by following the
+    "next" link of each page, adds each entity to the < cache > under its own URL, and builds a
+    < SearchIndex > that answers subsequent "search" queries against the category in-process
+    (see < get_cached_resource >).
+
+    Parameters:
+        url (str): SWAPI category URL
+        cache (dict|LRUCache|SQLiteCache): resource cache
+        writer (CacheWriter): optional write-behind writer notified of new entries
+        timeout (int): timeout value in seconds
+
+    Returns:
+        SearchIndex: search index over the category's entities
+    """
+
+    category_key = create_cache_key(url)
+    entities = []
+    page_url = url
+    while page_url:
+        page = get_cached_resource(cache, page_url, timeout=timeout, writer=writer, mode='frozen')
+        if page is None:
+            break
+        for entity in page['results']:
+            key = create_cache_key(entity['url'])
+            if key not in cache:
+                cache[key] = entity
+                if writer:
+                    writer.mark_dirty(key)
+            entities.append(entity)
+        page_url = page['next']
+
+    field = SWAPI_SEARCH_FIELDS.get(get_cache_category(category_key), 'name')
+    index = search_indexes[category_key] = SearchIndex(entities, field)
+    return index
+
+
+def read_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=',', columns=None):
+    """Accepts a file path, creates a file object, and returns a list of dictionaries that
+    represent the row values using the cvs.DictReader(). Delegates to the function
+    < stream_csv_to_dicts > the task of reading the rows; if < columns > is provided each
+    dictionary is limited to those columns.
+
+    WARN: This function must be implemented using a list comprehension in order to earn points.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        columns (seq): optional column names to include (default: all columns)
+
+    Returns:
+        list: nested dictionaries representing the file contents
+     """
+
+    return [line for line in stream_csv_to_dicts(filepath, encoding, newline, delimiter, columns)]
+
+
+def read_json(filepath, encoding='utf-8'):
+    """Reads a JSON document, decodes the file content, and returns a list or dictionary if
+    provided with a valid filepath.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+
+    Returns:
+        dict/list: dict or list representations of the decoded JSON document
+    """
+
+    with open(filepath, 'r', encoding=encoding) as file_obj:
+        return get_json_backend().loads(file_obj.read())
+
+
+def read_json_lines(filepath, encoding='utf-8'):
+    """Lazily reads a JSON Lines file (one JSON value per line, see < write_json_lines >),
+    yielding one decoded value at a time. Blank lines are skipped. Only the current line is held
+    in memory, so records may be processed one at a time as each stage of a pipeline produces
+    them (e.g., read_json_lines -> transform generator -> write_json_lines).
+
+    WARN: the file remains open until the generator is exhausted or closed.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+
+    Returns:
+        generator: decoded values
+    """
+
+    loads = get_json_backend().loads
+    with open(filepath, 'r', encoding=encoding) as file_obj:
+        for line in file_obj:
+            if line.strip():
+                yield loads(line)
+
+
+def resolve_entities(entities, cache, keys=('homeworld', 'species'), writer=None,
+                     concurrency=HTTP_CONCURRENCY, timeout=HTTP_TIMEOUT):
+    """Returns new dictionaries in which the URL values of the passed in < keys > are replaced
+    by the resources they reference. URLs referenced by all < entities > are gathered and
+    resolved in a single batch by < resolve_urls >; values that are lists of URLs (e.g., a
+    person's "species") are replaced by lists of resources. Non-URL values are left unchanged.
+
+    Parameters:
+        entities (list): dictionary representations of SWAPI entities
+        cache (dict|LRUCache|SQLiteCache): resource cache
+        keys (tuple): keys whose URL values are to be resolved
+        writer (CacheWriter): optional write-behind writer notified of new entries
+        concurrency (int): maximum number of requests in flight
+        timeout (int): timeout value in seconds
+
+    Returns:
+        list: entities with URL values replaced by resources
+    """
+
+    urls = [url for entity in entities for key in keys for url in get_urls(entity.get(key))]
+    resources = resolve_urls(urls, cache, writer, concurrency, timeout)
+
+    resolved = []
+    for entity in entities:
+        entity = dict(entity)
+        for key in keys:
+            value = entity.get(key)
+            if isinstance(value, (list, tuple)):
+                entity[key] = [resources.get(url, url) if is_url(url) else url for url in value]
+            elif is_url(value):
+                entity[key] = resources[value]
+        resolved.append(entity)
+    return resolved
+
+
+def resolve_urls(urls, cache, writer=None, concurrency=HTTP_CONCURRENCY, timeout=HTTP_TIMEOUT):
+    """Resolves the passed in < urls > concurrently. Synchronous wrapper around
+    < resolve_urls_async >.
+
+    Parameters:
+        urls (iterable): SWAPI resource URLs
+        cache (dict|LRUCache|SQLiteCache): resource cache
+        writer (CacheWriter): optional write-behind writer notified of new entries
+        concurrency (int): maximum number of requests in flight
+        timeout (int): timeout value in seconds
+
+    Returns:
+        dict: URL to resource mappings
+    """
+
+    return asyncio.run(resolve_urls_async(urls, cache, writer, concurrency, timeout))
+
+
+async def resolve_urls_async(urls, cache, writer=None, concurrency=HTTP_CONCURRENCY,
+                             timeout=HTTP_TIMEOUT):
+    """Resolves the passed in < urls > to resources. Duplicate URLs are collapsed and cached
+    resources are returned without a request; the remaining misses are fetched concurrently
+    via < get_cached_resource >, which also adds them to the < cache >. The fetches run on a
+    dedicated pool of < concurrency > worker threads (the event loop's default executor is
+    capped at min(32, CPUs + 4) workers) and the shared session's connection pools are grown to
+    at least < concurrency > (see < get_session >), so that < concurrency > requests really are
+    in flight at once. The worker pool is shut down before returning.
+
+    Parameters:
+        urls (iterable): SWAPI resource URLs
+        cache (dict|LRUCache|SQLiteCache): resource cache
+        writer (CacheWriter): optional write-behind writer notified of new entries
+        concurrency (int): maximum number of requests in flight
+        timeout (int): timeout value in seconds
+
+    Returns:
+        dict: URL to resource mappings
+    """
+
+    resources = {}
+    misses = []
+    for url in dict.fromkeys(urls): # de-duplicate, preserving order
+        if create_cache_key(url) in cache:
+            resources[url] = get_cached_resource(cache, url, timeout=timeout, writer=writer)
+        else:
+            misses.append(url)
+
+    if not misses:
+        return resources
+
+    workers = min(concurrency, len(misses))
+    get_session(workers)
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fetches = [
+            loop.run_in_executor(executor, get_cached_resource, cache, url, None, timeout, writer)
+            for url in misses
+        ]
+        for url, resource in zip(misses, await asyncio.gather(*fetches)):
+            resources[url] = resource
+    return resources
+
+
+def share(value, mode=CACHE_VALUE_MODE):
+    """Returns a cache < value > in the form dictated by < mode >:
+
+    'copy': a fully mutable deep copy (delegated to < thaw >)
+    'cow': a copy-on-write view; nested values are copied only when accessed by key or index
+    'frozen': the frozen value itself; no copying at all
+
+    Parameters:
+        value (obj): cache value
+        mode (str): one of 'copy', 'cow', or 'frozen'
+
+    Returns:
+        obj: cache value shaped per < mode >
+    """
+
+    if mode == 'frozen':
+        return freeze(value)
+    if mode == 'cow':
+        if isinstance(value, dict):
+            return CopyOnWriteDict(freeze(value))
+        if isinstance(value, (list, tuple)):
+            return CopyOnWriteList(freeze(value))
+        return value
+    return thaw(value)
+
+
+def stream_cache_journal(filepath, encoding='utf-8'):
+    """Lazily reads a < CacheWriter > journal, yielding one (key, entry) pair per line in the
+    order the entries were appended. Blank lines and lines left incomplete by an interrupted
+    append are skipped. A missing journal yields nothing.
+
+    Parameters:
+        filepath (str): path to the journal
+        encoding (str): name of encoding used to decode the file
+
+    Returns:
+        generator: (key, entry) tuples
+    """
+
+    loads = get_json_backend().loads
+    try:
+        file_obj = open(filepath, 'r', encoding=encoding)
+    except FileNotFoundError:
+        return None
+    with file_obj:
+        for line in file_obj:
+            if not line.endswith('\n'):
+                break # torn final line
+            try:
+                key, entry = loads(line)
+            except ValueError:
+                continue # torn line terminated by a later append
+            yield key, entry
+
+
+def stream_csv(filepath, encoding='utf-8', newline='', delimiter=',', columns=None):
+    """Lazily reads a CSV file, yielding one "row" list at a time; the header row is yielded
+    first. If < columns > is provided each row (including the header row) is limited to the
+    named columns in the order given. Only the current row is held in memory, so memory use
+    stays flat regardless of file size.
+
+    WARN: the file remains open until the generator is exhausted or closed.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        columns (seq): optional column names to include (default: all columns)
+
+    Returns:
+        generator: "row" lists
+    """
+
+    with open(filepath, 'r', newline=newline, encoding=encoding) as file_obj:
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        if not columns:
+            yield from reader
+            return
+
+        headers = next(reader, None)
+        if headers is None:
+            return
+        indexes = [headers.index(column) for column in columns]
+        yield list(columns)
+        for row in reader:
+            yield [row[i] if i < len(row) else None for i in indexes]
+
+
+def stream_csv_to_dicts(filepath, encoding='utf-8', newline='', delimiter=',', columns=None):
+    """Lazily reads a CSV file, yielding one dictionary per row as returned by the
+    csv.DictReader(). If < columns > is provided only the named columns are retrieved from
+    each row before its dictionary is built; missing values are set to None. Only the current
+    row is held in memory, so filter and aggregate steps can consume a file of any size in a
+    single pass. Combine with < chunk > to process rows in fixed-size batches.
+
+    WARN: the file remains open until the generator is exhausted or closed.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        columns (seq): optional column names to include (default: all columns)
+
+    Returns:
+        generator: dictionaries representing the rows
+    """
+
+    with open(filepath, 'r', newline=newline, encoding=encoding) as file_obj:
+        if not columns:
+            yield from csv.DictReader(file_obj, delimiter=delimiter)
+            return
+
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        headers = next(reader, None)
+        if headers is None:
+            return
+        fields = [(column, headers.index(column)) for column in columns]
+        for row in reader:
+            if row: # csv.DictReader skips blank rows
+                yield {column: row[i] if i < len(row) else None for column, i in fields}
+
+
+def stream_json_array(filepath, encoding='utf-8', buffer_size=JSON_BUFFER_SIZE,
+                      max_element_size=None):
+    """Lazily reads a JSON document whose top-level value is an array, yielding one decoded
+    element (e.g., an article dictionary) at a time. The file is read in < buffer_size >
+    character blocks by a < JsonStreamReader >; decoded text is discarded, so memory use is
+    bounded by the largest element rather than the size of the file.
+
+    A json.JSONDecodeError is raised if the document is not an array, is malformed, or has
+    anything other than whitespace after the closing bracket (elements preceding the error will
+    already have been yielded); its position refers to the file. Elements are unbounded by
+    default; if < max_element_size > is provided a larger element raises a json.JSONDecodeError
+    ("Element exceeds max_element_size ...") rather than being read into memory.
+
+    WARN: the file remains open until the generator is exhausted or closed.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        buffer_size (int): characters read per block
+        max_element_size (int): optional maximum size of an element, in characters
+
+    Returns:
+        generator: decoded array elements
+    """
+
+    with open(filepath, 'r', encoding=encoding) as file_obj:
+        reader = JsonStreamReader(file_obj, buffer_size, max_element_size)
+        reader.expect('[', 'Expecting a top-level array')
+        if not reader.accept(']'):
+            while True:
+                yield reader.decode()
+                if reader.expect(',]', "Expecting ',' delimiter or ']'") == ']':
+                    break
+        reader.expect_end()
+
+
+def stream_json_object(filepath, encoding='utf-8', buffer_size=JSON_BUFFER_SIZE,
+                       max_element_size=None):
+    """Lazily reads a JSON document whose top-level value is an object (e.g., a cache file),
+    yielding one decoded key-value pair at a time. Reading, error handling, and
+    < max_element_size > are as described for < stream_json_array >; memory use is bounded by
+    the largest value.
+
+    WARN: the file remains open until the generator is exhausted or closed.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+        buffer_size (int): characters read per block
+        max_element_size (int): optional maximum size of a key or value, in characters
+
+    Returns:
+        generator: (key, value) tuples
+    """
+
+    with open(filepath, 'r', encoding=encoding) as file_obj:
+        reader = JsonStreamReader(file_obj, buffer_size, max_element_size)
+        reader.expect('{', 'Expecting a top-level object')
+        if not reader.accept('}'):
+            while True:
+                if reader.peek() != '"':
+                    raise reader.error('Expecting property name enclosed in double quotes')
+                key = reader.decode()
+                reader.expect(':', "Expecting ':' delimiter")
+                yield key, reader.decode()
+                if reader.expect(',}', "Expecting ',' delimiter or '}'") == '}':
+                    break
+        reader.expect_end()
+
+
+def thaw(value):
+    """Returns a fully mutable deep copy of the passed in < value >. Dictionaries (frozen or
+    not) are converted to plain dictionaries and lists/tuples to lists, recursively.
+
+    Parameters:
+        value (obj): cache value
+
+    Returns:
+        dict|list|any: mutable copy of the value
+    """
+
+    if isinstance(value, dict):
+        return {key: thaw(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(val) for val in value]
+    return value
+
+
+def unpack_cache_entry(entry, created_at=None):
+    """Returns the value and creation time of an entry stored in a JSON cache file. Entries are
+    stored as {"created_at": <epoch>, "value": <resource>} (see < CacheWriter >); files written
+    before creation times were recorded hold the bare resource, in which case < created_at >
+    (e.g., the file's last modification time) is returned instead.
+
+    Parameters:
+        entry (obj): stored cache entry
+        created_at (float): fallback epoch timestamp for entries without a creation time
+
+    Returns:
+        tuple: value and epoch timestamp
+    """
+
+    if isinstance(entry, dict) and entry.keys() == {'created_at', 'value'}:
+        return entry['value'], entry['created_at']
+    return entry, created_at
+
+
+def write_json(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2, compact=False):
+    """Serializes object as JSON. Writes content to the provided filepath. Delegates to the
+    shared JSON backend (see < get_json_backend >) the task of encoding the object. If
+    < compact > is True the < indent > is ignored and the JSON is written without whitespace.
+
+    Parameters:
+        filepath (str): the path to the file
+        data (dict)/(list): the data to be encoded as JSON and written to the file
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+        compact (bool): if True writes single-line JSON with separators (',', ':')
+
+    Returns:
+        None
+    """
+
+    if compact:
+        text = get_json_backend().dumps(data, ensure_ascii, None, JSON_COMPACT_SEPARATORS)
+    else:
+        text = get_json_backend().dumps(data, ensure_ascii, indent)
+    with open(filepath, 'w', encoding=encoding) as file_obj:
+        file_obj.write(text)
+
+
+def write_json_atomic(filepath, data, encoding='utf-8', ensure_ascii=False, indent=2,
+                      compact=False):
+    """Serializes object as JSON and atomically replaces the file at < filepath >. Content is
+    first written to a temporary file located in the same directory, flushed to disk, and then
+    renamed over < filepath >. Readers therefore see either the previous or the new file,
+    never a partially written one. Encoding options are as described for < write_json >.
+
+    Parameters:
+        filepath (str): the path to the file
+        data (dict)/(list): the data to be encoded as JSON and written to the file
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+        compact (bool): if True writes single-line JSON with separators (',', ':')
+
+    Returns:
+        None
+    """
+
+    if compact:
+        text = get_json_backend().dumps(data, ensure_ascii, None, JSON_COMPACT_SEPARATORS)
+    else:
+        text = get_json_backend().dumps(data, ensure_ascii, indent)
+    dirpath = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_filepath = tempfile.mkstemp(dir=dirpath, prefix='.tmp-', suffix='.json')
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as file_obj:
+            file_obj.write(text)
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        os.remove(tmp_filepath)
+        raise
+
+
+def write_json_lines(filepath, records, encoding='utf-8', ensure_ascii=False):
+    """Serializes each of the passed in < records > as compact JSON and writes it to the
+    provided filepath as a single line (JSON Lines). < records > may be any iterable (e.g., a
+    generator); each record is encoded and written as it is produced and the file is line
+    buffered, so only the current record is held in memory and complete lines are visible to
+    readers (see < read_json_lines >) as soon as they are written.
+
+    Parameters:
+        filepath (str): the path to the file
+        records (iterable): values to be encoded as JSON and written to the file
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+
+    Returns:
+        int: number of records written
+    """
+
+    dumps = get_json_backend().dumps
+    count = 0
+    with open(filepath, 'w', encoding=encoding, buffering=1) as file_obj:
+        for record in records:
+            file_obj.write(dumps(record, ensure_ascii, None, JSON_COMPACT_SEPARATORS))
+            file_obj.write('\n')
+            count += 1
+    return count
+
+
+def write_json_object_atomic(filepath, items, encoding='utf-8', ensure_ascii=False, indent=2):
+    """Serializes the passed in < items > (key-value pairs) as a JSON object and atomically
+    replaces the file at < filepath >. < items > may be any iterable (e.g., a generator that
+    streams the file being replaced); only the current pair is held in memory. The output is
+    identical to that of < write_json > for the equivalent dictionary. The temporary file and
+    rename are handled as described for < write_json_atomic >.
+
+    Parameters:
+        filepath (str): the path to the file
+        items (iterable): (key, value) tuples to be encoded as JSON and written to the file
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): number of "pretty printed" indention spaces applied to encoded JSON
+
+    Returns:
+        int: number of key-value pairs written
+    """
+
+    dumps = get_json_backend().dumps
+    padding = '\n' + ' ' * indent
+    dirpath = os.path.dirname(os.path.abspath(filepath))
+    fd, tmp_filepath = tempfile.mkstemp(dir=dirpath, prefix='.tmp-', suffix='.json')
+    count = 0
+    try:
+        with os.fdopen(fd, 'w', encoding=encoding) as file_obj:
+            for key, value in items:
+                file_obj.write(',' + padding if count else '{' + padding)
+                file_obj.write(dumps(key, ensure_ascii))
+                file_obj.write(': ')
+                file_obj.write(dumps(value, ensure_ascii, indent).replace('\n', padding))
+                count += 1
+            file_obj.write('\n}' if count else '{}')
+            file_obj.flush()
+            os.fsync(file_obj.fileno())
+        os.replace(tmp_filepath, filepath)
+    except BaseException:
+        os.remove(tmp_filepath)
+        raise
+    return count
+
+
+def write_json_stream(filepath, records, encoding='utf-8', ensure_ascii=False, indent=None):
+    """Serializes the passed in < records > as a JSON array and writes it to the provided
+    filepath one element at a time. < records > may be any iterable (e.g., a generator); only
+    the current element is held in memory. By default the array is written compactly (no
+    whitespace); if < indent > is provided the output is "pretty printed" and is identical to
+    that of < write_json > for the equivalent list.
+
+    Parameters:
+        filepath (str): the path to the file
+        records (iterable): array elements to be encoded as JSON and written to the file
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (str): if False non-ASCII characters are printed as is; otherwise
+                            non-ASCII characters are escaped.
+        indent (int): optional number of "pretty printed" indention spaces
+
+    Returns:
+        int: number of elements written
+    """
+
+    dumps = get_json_backend().dumps
+    if indent is None:
+        separators = JSON_COMPACT_SEPARATORS
+        opening, delimiter, closing = '[', ',', ']'
+    else:
+        separators = (',', ': ')
+        padding = '\n' + ' ' * indent
+        opening, delimiter, closing = '[' + padding, ',' + padding, '\n]'
+
+    count = 0
     with open(filepath, 'w', encoding=encoding) as file_obj:
-        json.dump(data, file_obj, ensure_ascii=ensure_ascii, indent=indent)
+        for record in records:
+            value = dumps(record, ensure_ascii, indent, separators)
+            if indent is not None:
+                value = value.replace('\n', padding) # nest one level (strings escape newlines)
+            file_obj.write(delimiter if count else opening)
+            file_obj.write(value)
+            count += 1
+        file_obj.write(closing if count else '[]')
+    return count
@@ -0,0 +1,102 @@
+import argparse
+import os
+import timeit
+
+import five_oh_six as utl
+
+
+# Constants
+DIRPATH = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_FILEPATHS = ( # NYT and SWAPI fixtures
+    os.path.join(DIRPATH, 'data-nyt_star_wars_articles.json'),
+    os.path.join(DIRPATH, 'CACHE.json'),
+    os.path.join(DIRPATH, '..', 'lectures', 'lec_21', 'swapi_planets.json'),
+    os.path.join(DIRPATH, '..', 'lectures', 'lec_25', 'episode_iv_starships.json')
+)
+MODES = ( # (label, dumps keyword arguments)
+    ('encode (indent=2)', {'indent': 2}),
+    ('encode (compact)', {'separators': utl.JSON_COMPACT_SEPARATORS})
+)
+
+
+def get_backends():
+    """Returns a < utl.JsonBackend > for each backend listed in < utl.JSON_BACKENDS > that is
+    installed.
+
+    Parameters:
+        None
+
+    Returns:
+        list: installed backends
+    """
+
+    backends = []
+    for name in utl.JSON_BACKENDS:
+        try:
+            backends.append(utl.JsonBackend(name))
+        except ImportError:
+            continue
+    return backends
+
+
+def get_throughput(func, size, repeat):
+    """Times < func > and returns its throughput in megabytes per second based on the fastest
+    of < repeat > timings. The number of calls per timing is chosen so that each timing lasts
+    at least 0.2 seconds.
+
+    Parameters:
+        func (function): callable to time
+        size (int): bytes processed per call
+        repeat (int): number of timings
+
+    Returns:
+        float: megabytes per second
+    """
+
+    timer = timeit.Timer(func)
+    number = timer.autorange()[0]
+    seconds = min(timer.repeat(repeat=repeat, number=number)) / number
+    return size / seconds / 1_000_000
+
+
+def main():
+    """Entry point. Prints decode and encode throughput (MB/s) for each installed JSON backend
+    against each fixture file.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(description='JSON backend benchmark')
+    parser.add_argument('filepaths', nargs='*', default=FIXTURE_FILEPATHS, help='JSON files')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per measurement')
+    args = parser.parse_args()
+
+    backends = get_backends()
+    print(f"Backends: {', '.join(backend.name for backend in backends)}")
+
+    for filepath in args.filepaths:
+        try:
+            with open(filepath, 'r', encoding='utf-8') as file_obj:
+                text = file_obj.read()
+        except FileNotFoundError:
+            print(f"\nSkipping {filepath} (not found)")
+            continue
+        size = len(text.encode('utf-8'))
+        data = utl.JsonBackend('json').loads(text)
+        print(f"\n{os.path.relpath(filepath)} ({size / 1000:.1f} KB)")
+
+        for backend in backends:
+            results = [('decode', get_throughput(lambda: backend.loads(text), size, args.repeat))]
+            for label, kwargs in MODES:
+                results.append((label, get_throughput(
+                    lambda: backend.dumps(data, **kwargs), size, args.repeat)))
+            line = ', '.join(f"{label} {throughput:.1f}" for label, throughput in results)
+            print(f"{backend.name:>8}: {line} MB/s")
+
+
+if __name__ == '__main__':
+    main()
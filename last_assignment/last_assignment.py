@@ -1,8 +1,89 @@
-import copy
 import five_oh_six as utl
 
 # Cache
-cache = utl.create_cache(utl.CACHE_FILEPATH)
+cache = utl.create_cache(
+    utl.CACHE_FILEPATH, utl.CACHE_MAX_ENTRIES, utl.CACHE_MAX_BYTES, utl.CACHE_TTLS
+)
+cache_writer = utl.CacheWriter(utl.CACHE_FILEPATH, cache)
+
+# Record schemas: (target key, source key[, converter]) or (target key, nested fields)
+DROID_FIELDS = (
+    ('url', 'url'),
+    ('name', 'name'),
+    ('model', 'model'),
+    ('manufacturer', 'manufacturer'),
+    ('create_date', 'create_year', utl.convert_to_year_era),
+    ('height_cm', 'height', utl.convert_to_float),
+    ('mass_kg', 'mass', utl.convert_to_float),
+    ('equipment', 'equipment', lambda value: utl.convert_to_list(value, delimiter='|')),
+    ('instructions', 'instructions')
+)
+PERSON_FIELDS = (
+    ('url', 'url'),
+    ('name', 'name'),
+    ('birth_date', 'birth_year', utl.convert_to_year_era),
+    ('height_cm', 'height', utl.convert_to_float),
+    ('mass_kg', 'mass', utl.convert_to_float),
+    ('homeworld', 'homeworld'),
+    ('species', 'species'),
+    ('force_sensitive', 'force_sensitive')
+)
+PLANET_FIELDS = (
+    ('url', 'url'),
+    ('name', 'name'),
+    ('location', (
+        ('region', 'region'),
+        ('sector', 'sector')
+    )),
+    ('suns', 'suns', utl.convert_to_int),
+    ('moons', 'moons', utl.convert_to_int),
+    ('orbital_period_days', 'orbital_period', utl.convert_to_float),
+    ('diameter_km', 'diameter', utl.convert_to_int),
+    ('gravity_std', 'gravity', utl.convert_gravity_value),
+    ('climate', 'climate', lambda value: utl.convert_to_list(value, delimiter=', ')),
+    ('terrain', 'terrain', lambda value: utl.convert_to_list(value, delimiter=', ')),
+    ('population', 'population', utl.convert_to_int)
+)
+SPECIES_FIELDS = (
+    ('url', 'url'),
+    ('name', 'name'),
+    ('classification', 'classification'),
+    ('designation', 'designation'),
+    ('average_lifespan', 'average_lifespan', utl.convert_to_int),
+    ('average_height_cm', 'average_height', utl.convert_to_float),
+    ('language', 'language')
+)
+STARSHIP_FIELDS = (
+    ('url', 'url'),
+    ('name', 'name'),
+    ('model', 'model'),
+    ('starship_class', 'starship_class'),
+    ('manufacturer', 'manufacturer'),
+    ('length_m', 'length', utl.convert_to_float),
+    ('propulsion', (
+        ('hyperdrive_rating', 'hyperdrive_rating', utl.convert_to_float),
+        ('max_megalight_hr', 'MGLT', utl.convert_to_int),
+        ('max_atmosphering_speed', 'max_atmosphering_speed', utl.convert_to_int)
+    )),
+    ('crew', (
+        ('crew_size', 'crew', utl.convert_to_int),
+        ('crew_members', 'crew_members')
+    )),
+    ('passengers', (
+        ('max_passengers', 'passengers', utl.convert_to_int),
+        ('on_board', 'passengers_on_board')
+    )),
+    ('cargo_capacity_kg', 'cargo_capacity', utl.convert_to_int),
+    ('consumables', 'consumables'),
+    ('armament', 'armament', lambda value: utl.convert_to_list(value, delimiter=','))
+)
+
+# Record converters compiled from the schemas (see utl.compile_record_converter)
+convert_droid = utl.compile_record_converter(DROID_FIELDS)
+convert_person = utl.compile_record_converter(PERSON_FIELDS, normalize='target')
+convert_planet = utl.compile_record_converter(PLANET_FIELDS)
+convert_species = utl.compile_record_converter(SPECIES_FIELDS)
+convert_starship = utl.compile_record_converter(STARSHIP_FIELDS, normalize='target')
 
 
 def assign_crew_members(crew_size, crew_positions, personnel):
@@ -63,8 +144,8 @@ def calculate_articles_mean_word_count(articles):
     are summed and then divided by the number of non-zero/non-< None > "word_count" articles. The
     resulting mean value is rounded to the second (2nd) decimal place and returned to the caller.
 
-    The function maintains a count of the number of articles evaluated and a count of the total
-    words accumulated from each article's "word_count" key-value pair.
+    The count of articles evaluated and the total words accumulated from each article's
+    "word_count" key-value pair are maintained by a < utl.RunningStats > instance.
 
     The function checks the truth value of each article's "word_count" before attempting to
     increment the count. If the truth vallue of the "word_count" is < False > the article is
@@ -77,16 +158,8 @@ def calculate_articles_mean_word_count(articles):
         float: mean word count rounded to the second (2nd) decimal place
     """
 
-    a = 0
-    b = 0
-    for i in range(len(articles)):
-        if articles[i]['word_count'] == 0:
-            b += 1
-        else:
-            a += articles[i]['word_count']
-    c = len(articles) - b
-    d = round(a/max(1,c), 2)
-    return d
+    stats = utl.RunningStats(article['word_count'] for article in articles if article['word_count'])
+    return round(stats.mean, 2) if stats.count else 0.0
 
 
 
@@ -163,12 +236,13 @@ def create_droid(data):
     """Returns a new "thinned" dictionary representation of a droid based on the passed in
     < data > dictionary, converting string values to more appropriate types whenever possible.
 
-    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison)
-    are first converted to < None > by calling < utl.convert_none_values > and returning
-    a new dictionary. Once that task is accomplished other < utl.convert_to_*() > functions
-    are called as necessary in an attempt to convert certain values to more appropriate types
-    per the "Type conversions" and "New/repurposed key-value pairs" listed below. Key-value
-    pairs that are retained, renamed, or added are listed below under "Key order".
+    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison) are
+    first converted to < None >. Once that task is accomplished other < utl.convert_to_*() >
+    functions are called as necessary in an attempt to convert certain values to more
+    appropriate types per the "Type conversions" and "New/repurposed key-value pairs" listed
+    below. Key-value pairs that are retained, renamed, or added are listed below under "Key
+    order". The conversion is performed in a single pass by < convert_droid >, which is compiled
+    from < DROID_FIELDS >.
 
     Type conversions:
         create_year (to dict)
@@ -201,36 +275,48 @@ def create_droid(data):
     Returns:
         dict: new dictionary
     """
-    data = utl.convert_none_values(data, utl.NONE_VALUES)
-    return {
-        'url': data.get('url'),
-        'name': data.get('name'),
-        'model': data.get('model'),
-        'manufacturer': data.get('manufacturer'),
-        'create_date': utl.convert_to_year_era(data.get('create_year')),
-        'height_cm': utl.convert_to_float(data.get('height')), # 注意原字典里面height后面是没有_cm的。
-        'mass_kg': utl.convert_to_float(data.get('mass')), # 注意原字典里面mass后面是没有_kg的。
-        'equipment': utl.convert_to_list(data.get('equipment'), delimiter='|'), #试一试要不要写成data.get("equipment").split("|")
-        'instructions': data.get('instructions')
-    }
+    return convert_droid(data)
+
+
+def create_people(people, planets=None):
+    """Returns a list of "thinned" dictionary representations of the passed in < people >.
+    Before delegating to the function < create_person > the task of creating each person, the
+    "homeworld" and "species" URLs referenced by < people > are replaced by the resources they
+    reference by < utl.resolve_entities >, which resolves every URL in a single concurrent
+    batch rather than waiting on each request in turn. Use in preference to < create_person >
+    whenever more than one person is created. People that were not found (None) are returned as
+    None in the same position.
+
+    Parameters:
+        people (list): source data
+        planets (list|utl.NameIndex): optional supplemental planetary data
+
+    Returns:
+        list: new dictionaries
+    """
+
+    found = iter(utl.resolve_entities(
+        [person for person in people if person], cache, ('homeworld', 'species'), cache_writer))
+    return [create_person(next(found), planets) if person else None for person in people]
 
 
 def create_person(data, planets=None):
     """Returns a new "thinned" dictionary representation of a person based on the passed in
     < data > dictionary, converting string values to more appropriate types whenever possible.
 
-    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison)
-    are first converted to < None > by calling < utl.convert_none_values > and returning
-    a new dictionary. Once that task is accomplished other < utl.convert_to_*() > functions
-    are called as necessary in an attempt to convert certain values to more appropriate types
-    per the "Type conversions" and "New/repurposed key-value pairs" listed below. Key-value
-    pairs that are retained, renamed, or added are listed below under "Key order".
+    < utl.convert_to_*() > functions are called as necessary in an attempt to convert certain
+    values to more appropriate types per the "Type conversions" and "New/repurposed key-value
+    pairs" listed below. Converted values that are members of < utl.NONE_VALUES > (case
+    insensitive comparison) are then converted to < None >. Key-value pairs that are retained,
+    renamed, or added are listed below under "Key order". The conversion is performed in a
+    single pass by < convert_person >, which is compiled from < PERSON_FIELDS >.
 
     Both the person's "homeworld" and "species" values are used to retrieve "thinned" dictionary
     representations of the planet and species values. Retrieving the homeworld is delegated
     to the function < get_homeworld > while retrieving the species is delegated to the function
     < get_species >. If an optional Wookieepedia-sourced < planets > list is provided, the
-    argument is passed on to < get_homeworld > for processing.
+    argument is passed on to < get_homeworld > for processing. Either value may already have
+    been replaced by the resource it references (see < create_people >).
 
 
     Type conversions:
@@ -257,7 +343,7 @@ def create_person(data, planets=None):
 
     Parameters:
         data (dict): source data
-        planets (list): optional supplemental planetary data
+        planets (list|utl.NameIndex): optional supplemental planetary data
 
     Returns:
         dict: new dictionary
@@ -266,27 +352,21 @@ def create_person(data, planets=None):
         new_homeworld = get_homeworld(data['homeworld'],planets)
     else:
         new_homeworld = get_homeworld(data['homeworld'])
-    return utl.convert_none_values({
-        'url': data.get('url'),
-        'name': data.get('name'),
-        'birth_date': utl.convert_to_year_era(data.get('birth_year')),
-        'height_cm': utl.convert_to_float(data.get('height')),
-        'mass_kg': utl.convert_to_float(data.get('mass')),
-        'homeworld': new_homeworld,
-        'species': get_species(data['species']),
-        'force_sensitive': data.get('force_sensitive')
-    }, utl.NONE_VALUES)
+    new_species = get_species(data['species'])
+    return convert_person({**data, 'homeworld': new_homeworld, 'species': new_species})
+
 
 def create_planet(data):
     """Returns a new "thinned" dictionary representation of a planet based on the passed in
     < data > dictionary, converting string values to more appropriate types whenever possible.
 
-    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison)
-    are first converted to < None > by calling < utl.convert_none_values > and returning
-    a new dictionary. Once that task is accomplished other < utl.convert_to_*() > functions
-    are called as necessary in an attempt to convert certain values to more appropriate types
-    per the "Type conversions" and "New/repurposed key-value pairs" listed below. Key-value
-    pairs that are retained, renamed, or added are listed below under "Key order".
+    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison) are
+    first converted to < None >. Once that task is accomplished other < utl.convert_to_*() >
+    functions are called as necessary in an attempt to convert certain values to more
+    appropriate types per the "Type conversions" and "New/repurposed key-value pairs" listed
+    below. Key-value pairs that are retained, renamed, or added are listed below under "Key
+    order". The conversion is performed in a single pass by < convert_planet >, which is
+    compiled from < PLANET_FIELDS >.
 
     Type conversions:
         suns (to int)
@@ -326,36 +406,20 @@ def create_planet(data):
     Returns:
         dict: new dictionary
     """
-    data = utl.convert_none_values(data, utl.NONE_VALUES)
-    return {
-        'url': data.get('url'),
-        'name': data.get('name'),
-        'location': {
-            'region': data.get('region'), 
-            'sector': data.get('sector')},
-        'suns': utl.convert_to_int(data.get('suns')),
-        'moons': utl.convert_to_int(data.get('moons')),
-        'orbital_period_days': utl.convert_to_float(data.get('orbital_period')),
-        'diameter_km': utl.convert_to_int(data.get('diameter')),
-        'gravity_std': utl.convert_gravity_value(data.get('gravity')),
-        'climate': utl.convert_to_list(data.get('climate'), delimiter=', '),
-        'terrain': utl.convert_to_list(data.get('terrain'), delimiter=', '), 
-        'population': utl.convert_to_int(data.get('population'))
-    }
-
-
+    return convert_planet(data)
 
 
 def create_species(data):
     """Returns a new "thinned" dictionary representation of a species based on the passed in
     < data > dictionary, converting string values to more appropriate types whenever possible.
 
-    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison)
-    are first converted to < None > by calling < utl.convert_none_values > and returning
-    a new dictionary. Once that task is accomplished other < utl.convert_to_*() > functions
-    are called as necessary in an attempt to convert certain values to more appropriate types
-    per the "Type conversions" and "New/repurposed key-value pairs" listed below. Key-value
-    pairs that are retained, renamed, or added are listed below under "Key order".
+    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison) are
+    first converted to < None >. Once that task is accomplished other < utl.convert_to_*() >
+    functions are called as necessary in an attempt to convert certain values to more
+    appropriate types per the "Type conversions" and "New/repurposed key-value pairs" listed
+    below. Key-value pairs that are retained, renamed, or added are listed below under "Key
+    order". The conversion is performed in a single pass by < convert_species >, which is
+    compiled from < SPECIES_FIELDS >.
 
     Type conversions:
         average_lifespan (to int)
@@ -379,28 +443,19 @@ def create_species(data):
     Returns:
         dict: new dictionary
     """
-    data = utl.convert_none_values(data, utl.NONE_VALUES)
-    return {
-        'url': data.get('url'),
-        'name': data.get('name'),
-        'classification': data.get('classification'),
-        'designation': data.get('designation'),
-        'average_lifespan': utl.convert_to_int(data.get('average_lifespan')),
-        'average_height_cm':utl.convert_to_float(data.get('average_height')),
-        'language': data.get('language')
-    }
+    return convert_species(data)
 
 
 def create_starship(data):
     """Returns a new "thinned" dictionary representation of a starship based on the passed in
     < data > dictionary, converting string values to more appropriate types whenever possible.
 
-    < data > values that are members of < utl.NONE_VALUES > (case insensitive comparison)
-    are first converted to < None > by calling < utl.convert_none_values > and returning
-    a new dictionary. Once that task is accomplished other < utl.convert_to_*() > functions
-    are called as necessary in an attempt to convert certain values to more appropriate types
-    per the "Type conversions" and "New/repurposed key-value pairs" listed below. Key-value
-    pairs that are retained, renamed, or added are listed below under "Key order".
+    < utl.convert_to_*() > functions are called as necessary in an attempt to convert certain
+    values to more appropriate types per the "Type conversions" and "New/repurposed key-value
+    pairs" listed below. Converted values that are members of < utl.NONE_VALUES > (case
+    insensitive comparison) are then converted to < None >. Key-value pairs that are retained,
+    renamed, or added are listed below under "Key order". The conversion is performed in a
+    single pass by < convert_starship >, which is compiled from < STARSHIP_FIELDS >.
 
     Assigning crews and passengers consitute separate operations.
 
@@ -466,42 +521,19 @@ def create_starship(data):
         dict: new dictionary
     """
 
-    return utl.convert_none_values({
-        'url': data.get('url'),
-        'name': data.get('name'),
-        'model': data.get('model'),
-        'starship_class': data.get('starship_class'),
-        'manufacturer': data.get('manufacturer'),
-        'length_m': utl.convert_to_float(data.get('length')),
-        'propulsion': utl.convert_none_values({
-            'hyperdrive_rating': utl.convert_to_float(data.get('hyperdrive_rating')),
-            'max_megalight_hr': utl.convert_to_int(data.get('MGLT')),
-            'max_atmosphering_speed': utl.convert_to_int(data.get('max_atmosphering_speed'))
-        }, utl.NONE_VALUES),
-        'crew': utl.convert_none_values({
-            'crew_size': utl.convert_to_int(data.get('crew')),
-            'crew_members': data.get('crew_members'),
-        },utl.NONE_VALUES),
-        'passengers': utl.convert_none_values({
-            'max_passengers': utl.convert_to_int(data.get('passengers')),
-            'on_board': data.get('passengers_on_board'),
-        }, utl.NONE_VALUES),
-        'cargo_capacity_kg': utl.convert_to_int(data.get('cargo_capacity')),
-        'consumables': data.get('consumables'),
-        'armament': utl.convert_to_list(data.get('armament'), delimiter=',')
-    }, utl.NONE_VALUES)
-
+    return convert_starship(data)
 
 
 def get_homeworld(identifier, planets=None):
     """Attempts to retrieve a SWAPI representation of a home planet using the provided
-    < identifier >. The < identifier > is assumed to be either a planet name (e.g., Dagobah) or a
-    SWAPI planet URL (e.g., https://swapi.py4e.com/api/planets/5/).
+    < identifier >. The < identifier > is assumed to be either a planet name (e.g., Dagobah), a
+    SWAPI planet URL (e.g., https://swapi.py4e.com/api/planets/5/), or a SWAPI planet dictionary
+    that has already been retrieved (e.g., by < utl.resolve_entities >).
 
-    If the < identifier > commences with the substring "https://" the < identifier > is considered a
-    URL and is passed to the function < get_swapi_resource() > as the < url > argument. Otherwise
-    the < identifier > is assumed to be a planet name and is passed to < get_swapi_resource() > as a
-    < params > value.
+    If < utl.is_url > reports that the < identifier > is an HTTP(S) URL (including one served by a
+    SWAPI_ENDPOINT override) it is passed to the function < get_swapi_resource() > as the < url >
+    argument. Otherwise the < identifier > is assumed to be a planet name and is passed to
+    < get_swapi_resource() > as a < params > value.
 
     If an optional Wookieepedia-sourced < planets > list is provided, the task of retrieving the
     appropriate nested dictionary is delegated to the function < get_wookieepedia_data() >.
@@ -514,25 +546,28 @@ def get_homeworld(identifier, planets=None):
     returned to the caller.
 
     Parameters:
-        identifier (str): either a planet name or a SWAPI planet URL
-        planets (list): optional supplemental planetary data
+        identifier (str|dict): planet name, SWAPI planet URL, or SWAPI planet dictionary
+        planets (list|utl.NameIndex): optional supplemental planetary data
 
     Returns:
-        dict: "thinned" dictionary representation of a planet
+        dict|None: "thinned" dictionary representation of a planet; None if not found
     """
 
     # pass
     
-    if 'https://' in identifier:
-        return create_planet(get_swapi_resource(identifier))
+    if not isinstance(identifier, str):
+        swapi_data = identifier # already retrieved (None if not found)
+    elif utl.is_url(identifier):
+        swapi_data = get_swapi_resource(identifier)
     else:
-        if not planets:
-            return create_planet(get_swapi_resource(utl.SWAPI_PLANETS, params={'search': identifier}))
-        else:
-            swapi_data = get_swapi_resource(utl.SWAPI_PLANETS, params={'search': identifier})['results'][0]
+        swapi_data = utl.get_first_result(
+            get_swapi_resource(utl.SWAPI_PLANETS, params={'search': identifier}))
+        if swapi_data and planets:
             wookie_data = get_wookieepedia_data(planets, identifier)
             swapi_data.update(wookie_data)
-            return create_planet(swapi_data)
+    if not swapi_data:
+        return None # not found
+    return create_planet(swapi_data)
     
     # print(dic)  
     
@@ -540,37 +575,38 @@ def get_homeworld(identifier, planets=None):
 def get_species(identifier):
     """Attempts to retrieve a SWAPI representation of a species using the provided < identifier >.
     The < identifier > is assumed to be either the species name (e.g., Wookiee), a SWAPI species URL
-    (e.g., https://swapi.py4e.com/api/species/3/), or a < list > that holds the SWAPI species URL.
+    (e.g., https://swapi.py4e.com/api/species/3/), a SWAPI species dictionary that has already
+    been retrieved (e.g., by < utl.resolve_entities >), or a < list > that holds one of these.
 
     The function checks the < identifer > type. If the < identifier > is a list rather than a
     string, the function accesses the first list element and assigns it to < identifier >.
 
-    If the < identifier > commences with the substring "https://" the < identifier > is considered a
-    URL and is passed to the function < get_swapi_resource() > as the < url > argument. Otherwise
-    the < identifier > is assumed to be a species name and is passed to < get_swapi_resource() > as
-    a < params > value.
+    If < utl.is_url > reports that the < identifier > is an HTTP(S) URL (including one served by a
+    SWAPI_ENDPOINT override) it is passed to the function < get_swapi_resource() > as the < url >
+    argument. Otherwise the < identifier > is assumed to be a species name and is passed to
+    < get_swapi_resource() > as a < params > value.
 
     The SWAPI species dictionary is then passed to the function < create_species()` > for further
     processing. This results in a "thinned" dictionary representation of the species which is then
     returned to the caller.
 
     Parameters:
-        identifier (str): either a planet name or a SWAPI planet URL
+        identifier (str|dict|list): species name, SWAPI species URL, or SWAPI species dictionary
 
     Returns:
-        dict: "thinned" dictionary representation of a species
+        dict|None: "thinned" dictionary representation of a species; None if not found
     """
     if isinstance(identifier, list):
         identifier = identifier[0]
-        if "https://" in identifier:
-            data = get_swapi_resource(identifier)
-        else:
-            data = get_swapi_resource(f"{utl.SWAPI_SPECIES}", params={'search': identifier})['results'][0]
+    if not isinstance(identifier, str):
+        data = identifier # already retrieved (None if not found)
+    elif utl.is_url(identifier):
+        data = get_swapi_resource(identifier)
     else:
-        if "https://" in identifier:
-            data = get_swapi_resource(identifier)
-        else:
-            data = get_swapi_resource(f"{utl.SWAPI_SPECIES}", params={'search': identifier})['results'][0]
+        data = utl.get_first_result(
+            get_swapi_resource(f"{utl.SWAPI_SPECIES}", params={'search': identifier}))
+    if not data:
+        return None # not found
     return create_species(data)
 
 
@@ -621,29 +657,29 @@ def get_nyt_news_desks(articles):
         list: news desk strings (no duplicates)
     """
 
-    list = []
+    news_desks = {} # dict keys preserve first-seen order and make membership checks O(1)
     for article in articles:
-        if utl.convert_to_none(article['news_desk'], utl.NONE_VALUES) and (article['news_desk'] not in list):
-            list.append(article['news_desk'])
-        else:
-            continue
-    return list
+        if utl.convert_to_none(article['news_desk'], utl.NONE_VALUES):
+            news_desks[article['news_desk']] = None
+    return list(news_desks)
 
 
 
 def get_swapi_resource(url, params=None, timeout=10):
-    """Retrieves a de(ep copy of a SWAPI resource from either the local < cache >
-    dictionary or from a remote API if no local copy exists. Delegates to the function
-    < utl.create_cache_key > the task of minting a key that is used to identify a cached
-    resource. If the desired resource is not located in the cache, delegates to the
-    function < get_resource > the task of retrieving the resource from SWAPI.
-    A deep copy of the resource retrieved remotely is then added to the local < cache > by
-    mapping it to a new < cache[key] >. The mutated cache is written to the file
-    system before a deep copy of the resource is returned to the caller.
-
-    WARN: Deep copying is required to guard against possible mutatation of the cached
-    objects when dictionaries representing SWAPI entities (e.g., films, people, planets,
-    species, starships, and vehicles) are modified by other processes.
+    """Retrieves a SWAPI resource from either the local < cache > dictionary or from a remote
+    API if no local copy exists. Delegates to the function < utl.get_cached_resource > the
+    task of minting the cache key, checking the cache and, if the desired resource is not
+    located in the cache, retrieving the resource from SWAPI. A frozen (read-only) copy of the
+    resource retrieved remotely is added to the local < cache > and the new key is reported to
+    < cache_writer > which persists the mutated cache to the file system in batches
+    (write-behind).
+
+    WARN: Cached values are stored frozen and handed out per < utl.CACHE_VALUE_MODE > via
+    < utl.share >. In the default 'cow' (copy-on-write) mode callers that only read the
+    resource pay no copying cost, while callers that mutate it (e.g., < dict.update >) operate
+    on private copies, guarding the cached objects against mutation when dictionaries
+    representing SWAPI entities (e.g., films, people, planets, species, starships, and
+    vehicles) are modified by other processes.
 
     Parameters:
         url (str): a uniform resource locator that specifies the resource.
@@ -654,18 +690,10 @@ def get_swapi_resource(url, params=None, timeout=10):
         dict|list: requested resource sourced from either the local cache or a remote API
       """
 
-    key = utl.create_cache_key(url, params)
-    if key in cache.keys():
-        return copy.deepcopy(cache[key]) # recursive copy of objects
-    else:
-        resource = utl.get_resource(url, params, timeout)
-        cache[key] = copy.deepcopy(resource) # recursive copy of objects
-        utl.write_json(utl.CACHE_FILEPATH, cache) # persist mutated cache
+    return utl.get_cached_resource(cache, url, params, timeout, cache_writer)
 
-        return resource
 
-
-def get_wookieepedia_data(wookiee_data, filter):
+def get_wookieepedia_data(wookiee_data, filter, fuzzy=False):
     """Attempts to retrieve a Wookieepedia sourced dictionary representation of a
     Star Wars entity (e.g., droid, person, planet, species, starship, or vehicle)
     from the < wookiee_data > list using the passed in filter value. The function performs
@@ -673,19 +701,35 @@ def get_wookieepedia_data(wookiee_data, filter):
     passed in < filter > value. If a match is obtained the dictionary is returned to the
     caller; otherwise None is returned.
 
+    Matching is delegated to a < utl.NameIndex >. Callers that look up more than one name in
+    the same list should build the index once and pass it as < wookiee_data >, so each call is
+    a single dictionary lookup rather than a scan; a list is indexed on every call.
+
+    If < fuzzy > is True and no exact match is obtained, the closest name within
+    < utl.FUZZY_MAX_DISTANCE > edits, ignoring accents (e.g., 'Padme Amidala' for
+    'Padmé Amidala'), is matched instead via < utl.NameIndex.best >.
+
     Parameters:
-        wookiee_data (list): Wookieepedia-sourced data stored in a list of nested dictionaries
+        wookiee_data (list|utl.NameIndex): Wookieepedia-sourced data stored in a list of nested
+                                           dictionaries, or an index of that list
         filter (str): name value used to match on a dictionary's "name" value
+        fuzzy (bool): if True fall back to approximate name matching
 
     Returns
         dict|None: Wookieepedia-sourced data dictionary if match on the filter is obtained;
                    otherwise returns None
     """
 
+    if not isinstance(wookiee_data, utl.NameIndex):
+        wookiee_data = utl.NameIndex(wookiee_data)
+
     dict = {}
-    for element in wookiee_data:
-        if element['name'].lower() == filter.lower():
-            dict.update(element) 
+    for element in wookiee_data.get(filter, []):
+        dict.update(element)
+    if not dict and fuzzy:
+        element = wookiee_data.best(filter)
+        if element:
+            dict.update(element)
     return dict
 
 
@@ -715,6 +759,11 @@ def group_nyt_articles_by_news_desk(news_desks, articles):
         word_count
         pub_date
 
+    Keys follow the order of < news_desks > (desks without articles map to an empty list).
+    Articles are grouped in a single pass (see < utl.group_by >); news desk names are matched
+    case-insensitively. Delegates to the function < thin_nyt_article > the task of thinning
+    each article.
+
     Parameters:
         news_desks (list): list of news_desk names
         articles (list): nested dictionary representations of New York Times articles
@@ -723,25 +772,16 @@ def group_nyt_articles_by_news_desk(news_desks, articles):
         dict: key-value pairs that group articles by their parent news desk
     """
 
-    dict = {}
-    for name in news_desks: # 哪个是outer loop，哪个是inner loop结果是不一样的。Q1：区别是啥呀？
-        for article in articles:
-            if article['news_desk'].lower() == name.lower():
-                a ={'web_url': article.get('web_url'),
-                    'headline_main': article.get('headline').get('main'),
-                    'news_desk':article.get('news_desk'),
-                    'byline_original':article.get('byline').get('original'),
-                    'document_type':article.get('document_type'),
-                    'material_type':article.get('type_of_material'),
-                    'abstract':article.get('abstract'),
-                    'word_count':article.get('word_count'),
-                    'pub_date':article.get('pub_date')
-                    }
-                if article['news_desk'] not in dict:
-                    dict[article['news_desk']] = [a] # 建立一个键，即一个seed。
-                else:
-                    dict[article['news_desk']].append(a)  # dict[article['news_desk']]对应的是其相应的值，值是list,所以可以用append。
-    return dict
+    groups = {news_desk: [] for news_desk in news_desks}
+    names = {news_desk.lower(): news_desk for news_desk in news_desks}
+    grouped = utl.group_by(
+        articles,
+        lambda article: names.get(article['news_desk'].lower()),
+        thin_nyt_article
+    )
+    for news_desk, group in grouped.items():
+        groups[news_desk].extend(group)
+    return groups
 
 
 def has_viewer_data(episode):
@@ -762,6 +802,66 @@ def has_viewer_data(episode):
         return False
 
 
+def summarize_nyt_articles(articles):
+    """Groups the passed in < articles > by news desk and computes each news desk's mean word
+    count in a single pass over < articles >. Returns a three-item tuple ordered as follows:
+
+    ( < news desks >, < news desk articles >, < news desk mean word counts > )
+
+    Word counts are accumulated per news desk in a < utl.GroupedStats > as each article is
+    grouped. The values are identical to those returned by < get_nyt_news_desks >,
+    < group_nyt_articles_by_news_desk >, and < calculate_articles_mean_word_count > (news desks
+    with a mean word count of zero (0) are omitted), with news desks ordered by first appearance.
+
+    Parameters:
+        articles (iterable): nested dictionary representations of New York Times articles
+
+    Returns:
+        tuple: news desk list, grouped (thinned) articles, and mean word counts
+    """
+
+    news_desk_articles = {}
+    word_counts = utl.GroupedStats() # updated per article; no rescan of the groups
+    for article in articles:
+        news_desk = article['news_desk']
+        if not utl.convert_to_none(news_desk, utl.NONE_VALUES):
+            continue
+        news_desk_articles.setdefault(news_desk, []).append(thin_nyt_article(article))
+        if article['word_count']:
+            word_counts.add(news_desk, article['word_count'])
+
+    mean_word_counts = {}
+    for news_desk in news_desk_articles:
+        stats = word_counts.get(news_desk)
+        if stats and round(stats.mean, 2) != 0:
+            mean_word_counts[news_desk] = round(stats.mean, 2)
+    return list(news_desk_articles), news_desk_articles, mean_word_counts
+
+
+def thin_nyt_article(article):
+    """Returns a "thinned" version of the passed in New York Times < article > (see
+    < group_nyt_articles_by_news_desk > for the key order).
+
+    Parameters:
+        article (dict): New York Times article
+
+    Returns:
+        dict: thinned article
+    """
+
+    return {
+        'web_url': article.get('web_url'),
+        'headline_main': article.get('headline').get('main'),
+        'news_desk': article.get('news_desk'),
+        'byline_original': article.get('byline').get('original'),
+        'document_type': article.get('document_type'),
+        'material_type': article.get('type_of_material'),
+        'abstract': article.get('abstract'),
+        'word_count': article.get('word_count'),
+        'pub_date': article.get('pub_date')
+    }
+
+
 def main():
     """Entry point for program.
 
@@ -852,28 +952,18 @@ def main():
     # TODO Get data
     # TODO Call function
     # TODO Write to file
-    articles = utl.read_json('./data-nyt_star_wars_articles.json')
-    news_desks = get_nyt_news_desks(articles)
+    articles = utl.stream_json_array('./data-nyt_star_wars_articles.json')
+    news_desks, news_desk_articles, mean_word_counts = summarize_nyt_articles(articles)
     utl.write_json('stu-nyt_news_desks.json', news_desks)
     # 9.7 CHALLENGE 07
 
     # 9.7.2
     # TODO Call function
     # TODO Write to file
-    news_desk_articles = group_nyt_articles_by_news_desk(news_desks, articles)
     utl.write_json('stu-nyt_news_desk_articles.json', news_desk_articles)
     # 9.8 CHALLENGE 08
 
     # 9.8.2
-    ignore = ('Business Day', 'Movies')
-    mean_word_counts = {}
-    # TODO Implement loop
-    for key in news_desk_articles.keys():
-        # print('sssssssssssssss', key, news_desk_articles[key])
-        if news_desk_articles[key] not in ignore:
-            a = {key: calculate_articles_mean_word_count(news_desk_articles[key])} # 一定要在if里先写出这个dict,然后再update。否则这个dict只会出现最后一个值。
-            if calculate_articles_mean_word_count(news_desk_articles[key]) != 0:
-                mean_word_counts.update(a)
     # print(f"\nCHALLENGE 09: {mean_word_counts}")
 
     utl.write_json('stu-nyt_news_desk_mean_word_counts.json', mean_word_counts)
@@ -886,9 +976,10 @@ def main():
     # TODO Call functions
     # TODO Write to files
     wookiee_planets = utl.read_csv_to_dicts('data-wookieepedia_planets.csv')
-    wookiee_dagobah = get_wookieepedia_data(wookiee_planets, 'dagobah')
+    wookiee_planet_index = utl.NameIndex(wookiee_planets) # built once; reused by every lookup
+    wookiee_dagobah = get_wookieepedia_data(wookiee_planet_index, 'dagobah')
     utl.write_json('stu-wookiee_dagobah.json', wookiee_dagobah)
-    wookiee_haruun_kal = get_wookieepedia_data(wookiee_planets, 'HARUUN KAL')
+    wookiee_haruun_kal = get_wookieepedia_data(wookiee_planet_index, 'HARUUN KAL')
     utl.write_json('stu-wookiee_haruun_kal.json', wookiee_haruun_kal)
 
 
@@ -919,11 +1010,13 @@ def main():
     # 9.11.4
     # TODO Call functions
     # TODO Write to file
-    swapi_tatooine = get_swapi_resource(utl.SWAPI_PLANETS, {'search': 'Tatooine'})['results'][0]
+    swapi_tatooine = utl.get_first_result(
+        get_swapi_resource(utl.SWAPI_PLANETS, {'search': 'Tatooine'}))
     # print(swapi_tatooine)
     # swapi_tatooine = utl.get_resource(utl.SWAPI_PLANETS, {'search': 'Tatooine'})
-    wookiee_tatooine = get_wookieepedia_data(wookiee_planets, 'Tatooine')
-    if wookiee_tatooine not in utl.NONE_VALUES:
+    wookiee_tatooine = get_wookieepedia_data(wookiee_planet_index, 'Tatooine')
+    tatooine = None # not found
+    if swapi_tatooine and wookiee_tatooine not in utl.NONE_VALUES:
         swapi_tatooine.update(wookiee_tatooine)
         tatooine = create_planet(swapi_tatooine)
     # print(f"\nCHALLENGE 12: {tatooine}")
@@ -943,10 +1036,11 @@ def main():
     # TODO Get data
     # TODO Call functions
     # TODO Write to file
-    wookiee_droids = utl.read_json('data-wookieepedia_droids.json')
-    swapi_r2_d2 = get_swapi_resource(utl.SWAPI_PEOPLE, {'search': 'R2-D2'})['results'][0]
+    wookiee_droids = utl.NameIndex(utl.read_json('data-wookieepedia_droids.json'))
+    swapi_r2_d2 = utl.get_first_result(get_swapi_resource(utl.SWAPI_PEOPLE, {'search': 'R2-D2'}))
     wookiee_r2_d2 = get_wookieepedia_data(wookiee_droids, 'R2-D2')
-    if wookiee_r2_d2:
+    r2_d2 = None # not found
+    if swapi_r2_d2 and wookiee_r2_d2:
         swapi_r2_d2.update(wookiee_r2_d2)
         r2_d2 = create_droid(swapi_r2_d2)
     # print(f"\nCHALLENGE 13: {r2_d2}")
@@ -960,8 +1054,9 @@ def main():
     # TODO Write to file
 
     
-    swapi_human_species = get_swapi_resource(utl.SWAPI_SPECIES, {'search': 'Human'})['results'][0]
-    human_species = create_species(swapi_human_species) 
+    swapi_human_species = utl.get_first_result(
+        get_swapi_resource(utl.SWAPI_SPECIES, {'search': 'Human'}))
+    human_species = create_species(swapi_human_species) if swapi_human_species else None
     # print(f"\nCHALLENGE 14: {human_species}")
 
     utl.write_json('stu-human_species.json', human_species)
@@ -972,11 +1067,12 @@ def main():
     # TODO Get data
     # TODO Call functions
     # TODO Write to files
-    swapi_anakin = utl.get_resource(utl.SWAPI_PEOPLE, {'search': 'Anakin Skywalker'})['results'][0]
-    anakin_swapi_homeworld = get_homeworld(swapi_anakin['homeworld'])
+    swapi_anakin = utl.get_first_result(
+        utl.get_resource(utl.SWAPI_PEOPLE, {'search': 'Anakin Skywalker'}))
+    anakin_swapi_homeworld = get_homeworld(swapi_anakin['homeworld']) if swapi_anakin else None
     utl.write_json('stu-anakin_swapi_homeworld.json', anakin_swapi_homeworld)
     
-    wookiee_people = utl.read_json('data-wookieepedia_people.json')
+    wookiee_people = utl.NameIndex(utl.read_json('data-wookieepedia_people.json'))
     wookiee_anakin = get_wookieepedia_data(wookiee_people, 'Anakin Skywalker')
 
     # 9.15 Challenge 15
@@ -985,7 +1081,9 @@ def main():
     # TODO Call functions
     # TODO Write to files
     # print(swapi_anakin['species'])
-    anakin_swapi_species = get_species(swapi_anakin['species'][0])
+    anakin_swapi_species = None # not found
+    if swapi_anakin and swapi_anakin['species']:
+        anakin_swapi_species = get_species(swapi_anakin['species'][0])
     utl.write_json('stu-anakin_swapi_species.json', anakin_swapi_species)
     # 9.16 CHALLENGE 16
     
@@ -993,13 +1091,13 @@ def main():
     # TODO Call functions
     # TODO Write to files
     
-    anakin = create_person(swapi_anakin, wookiee_planets)
-    utl.write_json('stu-anakin_skywalker.json', anakin)
-
-    swapi_obi_wan = get_swapi_resource(utl.SWAPI_PEOPLE, params={'search': 'Obi-Wan Kenobi'})['results'][0]
+    swapi_obi_wan = utl.get_first_result(
+        get_swapi_resource(utl.SWAPI_PEOPLE, params={'search': 'Obi-Wan Kenobi'}))
     wookiee_obi_wan = get_wookieepedia_data(wookiee_people, 'Obi-Wan Kenobi')
-    swapi_obi_wan.update(wookiee_obi_wan)
-    obi_wan = create_person(swapi_obi_wan, wookiee_planets)
+    if swapi_obi_wan and wookiee_obi_wan:
+        swapi_obi_wan.update(wookiee_obi_wan)
+    anakin, obi_wan = create_people([swapi_anakin, swapi_obi_wan], wookiee_planet_index)
+    utl.write_json('stu-anakin_skywalker.json', anakin)
     utl.write_json('stu-obi_wan_kenobi.json', obi_wan)
     # 9.17 CHALLENGE 17
 
@@ -1014,47 +1112,50 @@ def main():
     # 9.18 CHALLENGE 18
 
     # 9.18.2.1
-    swapi_padme = get_swapi_resource(utl.SWAPI_PEOPLE, params={'search': 'Padmé Amidala'})['results'][0]
+    swapi_padme = utl.get_first_result(
+        get_swapi_resource(utl.SWAPI_PEOPLE, params={'search': 'Padmé Amidala'}))
     wookiee_padme = get_wookieepedia_data(wookiee_people, 'Padmé Amidala')
-    swapi_padme.update(wookiee_padme)
-    padme = create_person(swapi_padme, wookiee_planets)
+    padme = None # not found
+    if swapi_padme:
+        if wookiee_padme:
+            swapi_padme.update(wookiee_padme)
+        padme = create_person(swapi_padme, wookiee_planet_index)
     utl.write_json('stu-padme_amidala.json', padme)
 
-    swapi_c_3po = get_swapi_resource(utl.SWAPI_PEOPLE, params={'search': 'C-3PO'})['results'][0]
-    wookiee_droids = utl.read_json("data-wookieepedia_droids.json")
+    swapi_c_3po = utl.get_first_result(
+        get_swapi_resource(utl.SWAPI_PEOPLE, params={'search': 'C-3PO'}))
     wookiee_c_3po = get_wookieepedia_data(wookiee_droids, 'C-3PO')
-    swapi_c_3po.update(wookiee_c_3po)
-    c_3po = create_droid(swapi_c_3po)
+    c_3po = None # not found
+    if swapi_c_3po:
+        if wookiee_c_3po:
+            swapi_c_3po.update(wookiee_c_3po)
+        c_3po = create_droid(swapi_c_3po)
     utl.write_json('stu-c_3po.json', c_3po)
-    twilight['passengers']['on_board'] = board_passengers(twilight['passengers']['max_passengers'], [padme, c_3po, r2_d2])
+    passengers = [passenger for passenger in (padme, c_3po, r2_d2) if passenger]
+    twilight['passengers']['on_board'] = board_passengers(twilight['passengers']['max_passengers'], passengers)
 
 
-    swapi_mace_windo = get_swapi_resource('https://swapi.py4e.com/api/people/51/')
-    wookiee_people = utl.read_json('data-wookieepedia_people.json')
+    swapi_mace_windo = get_swapi_resource(f"{utl.SWAPI_PEOPLE}51/")
     wookiee_mace_windo = get_wookieepedia_data(wookiee_people, 'Mace Windu')
     swapi_mace_windo.update(wookiee_mace_windo)
-    mace_windo = create_person(swapi_mace_windo, wookiee_planets)
-    utl.write_json('stu-mace_windo.json', mace_windo)
 
-    swapi_plo_koon = get_swapi_resource('https://swapi.py4e.com/api/people/58/')
-    wookiee_people = utl.read_json('data-wookieepedia_people.json')
+    swapi_plo_koon = get_swapi_resource(f"{utl.SWAPI_PEOPLE}58/")
     wookiee_plo_koon = get_wookieepedia_data(wookiee_people, 'Plo Koon')
     swapi_plo_koon.update(wookiee_plo_koon)
-    plo_koon = create_person(swapi_plo_koon, wookiee_planets)
-    utl.write_json('stu-polo_koon.json', plo_koon)
 
-    swapi_shaak_ti = get_swapi_resource('https://swapi.py4e.com/api/people/78/')
-    wookiee_people = utl.read_json('data-wookieepedia_people.json')
+    swapi_shaak_ti = get_swapi_resource(f"{utl.SWAPI_PEOPLE}78/")
     wookiee_shaak_ti = get_wookieepedia_data(wookiee_people, 'Shaak Ti')
     swapi_shaak_ti.update(wookiee_shaak_ti)
-    shaak_ti = create_person(swapi_shaak_ti, wookiee_planets)
-    utl.write_json('stu-shaak_ti.json', shaak_ti)
 
-    swapi_yoda = get_swapi_resource('https://swapi.py4e.com/api/people/20/')
-    wookiee_people = utl.read_json('data-wookieepedia_people.json')
+    swapi_yoda = get_swapi_resource(f"{utl.SWAPI_PEOPLE}20/")
     wookiee_yoda = get_wookieepedia_data(wookiee_people, 'Yoda')
     swapi_yoda.update(wookiee_yoda)
-    yoda = create_person(swapi_yoda, wookiee_planets)
+
+    mace_windo, plo_koon, shaak_ti, yoda = create_people(
+        [swapi_mace_windo, swapi_plo_koon, swapi_shaak_ti, swapi_yoda], wookiee_planet_index)
+    utl.write_json('stu-mace_windo.json', mace_windo)
+    utl.write_json('stu-polo_koon.json', plo_koon)
+    utl.write_json('stu-shaak_ti.json', shaak_ti)
     utl.write_json('stu-yoda.json', yoda)
 
     board_passengers(twilight['passengers']['max_passengers'], [padme, c_3po, r2_d2, mace_windo, plo_koon, shaak_ti, yoda])
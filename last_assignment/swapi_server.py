@@ -0,0 +1,250 @@
+import argparse
+import json
+import os
+import random
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+
+# Constants
+UPSTREAM_ENDPOINT = 'https://swapi.py4e.com/api'
+PAGE_SIZE = 10
+SEARCH_FIELDS = {'films': 'title'} # searchable field if not "name"
+DIRPATH = os.path.dirname(os.path.abspath(__file__))
+DATA_FILEPATHS = ( # recorded responses; earlier files take precedence
+    os.path.join(DIRPATH, 'CACHE.json'),
+    os.path.join(DIRPATH, '..', 'lectures', 'lec_21', 'swapi_planets.json'),
+    os.path.join(DIRPATH, '..', 'lectures', 'lec_25', 'episode_iv_starships.json'),
+    os.path.join(DIRPATH, '..', 'lectures', 'lec_24', 'films.json'),
+    os.path.join(DIRPATH, '..', 'lectures', 'lec_24', 'planets.json')
+)
+
+
+def add_entities(entities, data):
+    """Adds to < entities > every SWAPI entity found in the passed in recorded response
+    < data >. Recorded responses may be a cache dictionary (key-response pairs), a paginated
+    "envelope", a list of entities, or a single entity. Entities are identified by their "url"
+    value; an entity already present in < entities > is not replaced.
+
+    Parameters:
+        entities (dict): SWAPI entities keyed by URL path (e.g., "/api/planets/1/")
+        data (dict|list): recorded response(s)
+
+    Returns:
+        None
+    """
+
+    if isinstance(data, list):
+        for element in data:
+            add_entities(entities, element)
+    elif isinstance(data, dict):
+        url = data.get('url')
+        if isinstance(url, str) and url.startswith(UPSTREAM_ENDPOINT):
+            entities.setdefault(get_path(url), data)
+        elif 'results' in data:
+            add_entities(entities, data['results'])
+        else:
+            for value in data.values():
+                if isinstance(value, (dict, list)):
+                    add_entities(entities, value)
+
+
+def get_path(url):
+    """Returns the normalized path of the passed in < url > (lowercase, trailing slash).
+
+    Parameters:
+        url (str): URL or path
+
+    Returns:
+        str: normalized path
+    """
+
+    path = urlparse(url).path.lower()
+    return path if path.endswith('/') else f"{path}/"
+
+
+def load_entities(filepaths=DATA_FILEPATHS):
+    """Reads the recorded SWAPI responses stored in < filepaths > and returns the entities
+    they contain keyed by URL path. Missing files are skipped.
+
+    Parameters:
+        filepaths (tuple): paths to recorded responses
+
+    Returns:
+        dict: SWAPI entities keyed by URL path
+    """
+
+    entities = {}
+    for filepath in filepaths:
+        try:
+            with open(filepath, 'r', encoding='utf-8') as file_obj:
+                add_entities(entities, json.load(file_obj))
+        except FileNotFoundError:
+            continue
+    return entities
+
+
+def search_category(entities, category, search=None):
+    """Returns the entities in < category > whose searchable field contains < search > (case
+    insensitive), ordered by their numeric identifier. If < search > is None every entity in
+    the category is returned.
+
+    Parameters:
+        entities (dict): SWAPI entities keyed by URL path
+        category (str): SWAPI category (e.g., 'people', 'planets')
+        search (str): optional search term
+
+    Returns:
+        list: matching entities
+    """
+
+    prefix = f"/api/{category}/"
+    field = SEARCH_FIELDS.get(category, 'name')
+    term = search.casefold() if search is not None else None
+    matches = []
+    for path, entity in entities.items():
+        if not path.startswith(prefix) or path == prefix:
+            continue
+        if term is None or term in str(entity.get(field, '')).casefold():
+            identifier = path[len(prefix):].strip('/')
+            matches.append((int(identifier) if identifier.isdigit() else 0, entity))
+    return [entity for identifier, entity in sorted(matches, key=lambda match: match[0])]
+
+
+class SwapiServer(ThreadingHTTPServer):
+    """Local stand-in for SWAPI that replays recorded responses. Supports entity URLs
+    (e.g., /api/planets/1/), category listings with the "search" and "page" querystring
+    parameters returned in paginated envelopes, and the API root. Upstream URLs embedded in
+    responses are rewritten to point at the stand-in server.
+
+    Each request may be delayed by < latency > seconds (plus up to < jitter > seconds) and fails
+    with a 500 response with probability < error_rate >.
+
+    Parameters:
+        address (tuple): host and port to bind
+        entities (dict): SWAPI entities keyed by URL path
+        latency (float): seconds added to every response
+        jitter (float): maximum random seconds added to < latency >
+        error_rate (float): probability (0.0 - 1.0) of an injected error response
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address, entities, latency=0.0, jitter=0.0, error_rate=0.0):
+        super().__init__(address, SwapiRequestHandler)
+        self.entities = entities
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.endpoint = f"http://{self.server_address[0]}:{self.server_address[1]}/api"
+        self.requests = 0
+
+    def start(self):
+        """Serves requests on a daemon thread and returns the server.
+
+        Parameters:
+            None
+
+        Returns:
+            SwapiServer: the running server
+        """
+
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+class SwapiRequestHandler(BaseHTTPRequestHandler):
+    """Handles GET requests on behalf of < SwapiServer >."""
+
+    def do_GET(self):
+        self.server.requests += 1
+        delay = self.server.latency + random.uniform(0, self.server.jitter)
+        if delay:
+            time.sleep(delay)
+        if random.random() < self.server.error_rate:
+            return self.send_json(500, {'detail': 'Injected error'})
+
+        url = urlparse(self.path)
+        path = get_path(url.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        segments = [segment for segment in path.split('/') if segment]
+
+        if segments == ['api']:
+            categories = sorted({key.split('/')[2] for key in self.server.entities})
+            return self.send_json(200, {
+                category: f"{UPSTREAM_ENDPOINT}/{category}/" for category in categories})
+        if path in self.server.entities:
+            return self.send_json(200, self.server.entities[path])
+        if len(segments) == 2 and segments[0] == 'api':
+            return self.send_page(segments[1], params)
+        return self.send_json(404, {'detail': 'Not found'})
+
+    def log_message(self, format, *args):
+        pass # silence per-request logging
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False)
+        body = body.replace(UPSTREAM_ENDPOINT, self.server.endpoint).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_page(self, category, params):
+        results = search_category(self.server.entities, category, params.get('search'))
+        try:
+            page = int(params.get('page', 1))
+        except ValueError:
+            page = 0
+        if page < 1 or (page > 1 and (page - 1) * PAGE_SIZE >= len(results)):
+            return self.send_json(404, {'detail': 'Not found'})
+
+        def page_url(number):
+            query = {key: val for key, val in params.items() if key != 'page'}
+            query['page'] = number
+            return f"{UPSTREAM_ENDPOINT}/{category}/?{urlencode(query)}"
+
+        self.send_json(200, {
+            'count': len(results),
+            'next': page_url(page + 1) if page * PAGE_SIZE < len(results) else None,
+            'previous': page_url(page - 1) if page > 1 else None,
+            'results': results[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        })
+
+
+def main():
+    """Entry point. Starts the stand-in server. Point < five_oh_six > at it by setting the
+    SWAPI_ENDPOINT environment variable to the printed endpoint before running a script; set
+    CACHE_FILEPATH as well to keep the stand-in responses out of the shared cache file.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    parser = argparse.ArgumentParser(description='Local SWAPI stand-in server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8506)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added per response')
+    parser.add_argument('--jitter', type=float, default=0.0, help='max random extra seconds')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='injected 500 probability')
+    args = parser.parse_args()
+
+    entities = load_entities()
+    server = SwapiServer(
+        (args.host, args.port), entities, args.latency, args.jitter, args.error_rate)
+    print(f"Serving {len(entities)} SWAPI entities; SWAPI_ENDPOINT={server.endpoint}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import json
 import timeit
 
 """
@@ -12,42 +13,228 @@ number: execute stmt n times (default = 1 million).
 globals: specify a namespace in which to execute the code.
 
 garbage collection turned off temporarily during the timing.
+
+Compares four strategies for joining World Bank groups to economies (the upper middle income
+(UMC) economies of Europe & Central Asia): a nested for loop, a nested list comprehension, a
+hash join, and a sort-merge join. Each strategy is timed against the original data (1x) and
+against synthetically scaled copies (see < scale_data >). The nested loop strategies are
+O(groups x countries) and are only timed up to < NESTED_LOOP_MAX_SCALE >.
 """
 
-# Setup: retrieve data
-setup = """
-import json
-with open('./wb-groups-2021_2022.json', 'r', encoding='utf-8') as file_obj:
-    groups = json.load(file_obj)
+# Constants
+GROUP_CODE = 'UMC'
+REGION = 'Europe & Central Asia'
+SCALES = (1, 10, 100, 1000)
+NESTED_LOOP_MAX_SCALE = 10 # nested loops take minutes beyond this
+NUMBER = 10 # executions per timing at 1x (reduced as the scale increases)
+REPEAT = 3 # timings per strategy (fastest reported)
+
+
+def comprehension_join(groups, countries, group_code=GROUP_CODE, region=REGION):
+    """Returns the < countries > in < region > that are members of the < group_code > group.
+    Implemented as a nested list comprehension that compares every group with every country.
+
+    Parameters:
+        groups (list): group member dictionaries (group_code, country_code, ...)
+        countries (list): country dictionaries (country_code, region, ...)
+        group_code (str): group code filter
+        region (str): region filter
+
+    Returns:
+        list: matching country dictionaries
+    """
+
+    return [
+        country
+        for group in groups
+        for country in countries
+        if group['group_code'] == group_code
+        and country['country_code'] == group['country_code']
+        and country['region'] == region
+    ]
+
+
+def hash_join(groups, countries, group_code=GROUP_CODE, region=REGION):
+    """Returns the < countries > in < region > that are members of the < group_code > group.
+    Countries are filtered by < region > and indexed by "country_code" in a single pass; the
+    < group_code > members are then looked up in the index (O(groups + countries)). Results are
+    ordered as the nested loop strategies order them.
 
-with open('./wb-economies-2021_2022.json', 'r', encoding='utf-8') as file_obj:
-    countries = json.load(file_obj)"""
+    Parameters:
+        groups (list): group member dictionaries (group_code, country_code, ...)
+        countries (list): country dictionaries (country_code, region, ...)
+        group_code (str): group code filter
+        region (str): region filter
 
-# Time for loop
-for_loop = """
-umc = []
-for group in groups:
+    Returns:
+        list: matching country dictionaries
+    """
+
+    index = {}
     for country in countries:
-        if (group['group_code'] == 'UMC'
-            and country['country_code'] == group['country_code']
-            and country['region'] == 'Europe & Central Asia'):
-            umc.append(country)"""
+        if country['region'] == region:
+            index.setdefault(country['country_code'], []).append(country)
+
+    umc = []
+    for group in groups:
+        if group['group_code'] == group_code:
+            umc.extend(index.get(group['country_code'], ()))
+    return umc
+
+
+def nested_loop_join(groups, countries, group_code=GROUP_CODE, region=REGION):
+    """Returns the < countries > in < region > that are members of the < group_code > group.
+    Implemented as a nested for loop that compares every group with every country.
+
+    Parameters:
+        groups (list): group member dictionaries (group_code, country_code, ...)
+        countries (list): country dictionaries (country_code, region, ...)
+        group_code (str): group code filter
+        region (str): region filter
+
+    Returns:
+        list: matching country dictionaries
+    """
+
+    umc = []
+    for group in groups:
+        for country in countries:
+            if (group['group_code'] == group_code
+                and country['country_code'] == group['country_code']
+                and country['region'] == region):
+                umc.append(country)
+    return umc
+
+
+def read_json(filepath, encoding='utf-8'):
+    """Reads a JSON document, decodes the file content, and returns a list or dictionary if
+    provided with a valid filepath.
+
+    Parameters:
+        filepath (str): path to file
+        encoding (str): name of encoding used to decode the file
+
+    Returns:
+        dict | list: dictionary or list representations of the decoded JSON document
+    """
+
+    with open(filepath, 'r', encoding=encoding) as file_obj:
+        return json.load(file_obj)
+
+
+def scale_data(groups, countries, scale):
+    """Returns copies of < groups > and < countries > enlarged < scale > times. Copy n (n > 0)
+    of each record has its "country_code" suffixed with n, so that each copy of a country joins
+    only with the matching copy of its group memberships and the number of matches grows
+    linearly with < scale >.
+
+    Parameters:
+        groups (list): group member dictionaries
+        countries (list): country dictionaries
+        scale (int): number of copies
+
+    Returns:
+        tuple: scaled groups list and scaled countries list
+    """
+
+    def copy(records, n):
+        if not n:
+            return list(records)
+        return [{**record, 'country_code': f"{record['country_code']}{n}"} for record in records]
+
+    scaled_groups = []
+    scaled_countries = []
+    for n in range(scale):
+        scaled_groups.extend(copy(groups, n))
+        scaled_countries.extend(copy(countries, n))
+    return scaled_groups, scaled_countries
+
+
+def sort_merge_join(groups, countries, group_code=GROUP_CODE, region=REGION):
+    """Returns the < countries > in < region > that are members of the < group_code > group.
+    The filtered groups and countries are sorted by "country_code" and then merged by advancing
+    through both sorted lists in step (O(n log n)). Results are ordered by "country_code".
+
+    Parameters:
+        groups (list): group member dictionaries (group_code, country_code, ...)
+        countries (list): country dictionaries (country_code, region, ...)
+        group_code (str): group code filter
+        region (str): region filter
+
+    Returns:
+        list: matching country dictionaries
+    """
+
+    members = sorted(
+        group['country_code'] for group in groups if group['group_code'] == group_code)
+    candidates = sorted(
+        (country for country in countries if country['region'] == region),
+        key=lambda country: country['country_code']
+    )
+
+    umc = []
+    i = j = 0
+    while i < len(members) and j < len(candidates):
+        code = candidates[j]['country_code']
+        if members[i] < code:
+            i += 1
+        elif members[i] > code:
+            j += 1
+        else:
+            k = j # emit every country sharing the code, once per group membership
+            while k < len(candidates) and candidates[k]['country_code'] == code:
+                umc.append(candidates[k])
+                k += 1
+            i += 1
+    return umc
+
+
+def main():
+    """Entry point. Times each join strategy at each scale and prints the fastest timing.
+
+    Parameters:
+        None
+
+    Returns:
+        None
+    """
+
+    groups = read_json('./wb-groups-2021_2022.json')
+    countries = read_json('./wb-economies-2021_2022.json')
+    strategies = (
+        ('for loop', nested_loop_join),
+        ('list comprehension', comprehension_join),
+        ('hash join', hash_join),
+        ('sort-merge join', sort_merge_join)
+    )
+
+    for scale in SCALES:
+        scaled_groups, scaled_countries = scale_data(groups, countries, scale)
+        number = max(1, NUMBER // scale)
+        expected = None
+        print(f"\n{scale}x: {len(scaled_groups)} groups, {len(scaled_countries)} countries "
+              f"({number} execution(s) per timing)")
 
-for_loop_time = timeit.timeit(stmt=for_loop, setup=setup, number=500)
+        for name, strategy in strategies:
+            nested = strategy in (nested_loop_join, comprehension_join)
+            if nested and scale > NESTED_LOOP_MAX_SCALE:
+                print(f"{name:>20} = skipped")
+                continue
 
-print(f"\nFor loop execution time = {for_loop_time}")
+            # Check that every strategy finds the same countries
+            umc = strategy(scaled_groups, scaled_countries)
+            umc = sorted(country['country_code'] for country in umc)
+            if expected is None:
+                expected = umc
+            assert umc == expected, f"{name} returned a different result"
 
-# Time list comprehension
-list_comp = """
-umc = [
-    country
-    for group in groups
-    for country in countries
-    if group['group_code'] == 'UMC'
-    and country['country_code'] == group['country_code']
-    and country['region'] == 'Europe & Central Asia'
-]"""
+            seconds = min(timeit.repeat(
+                stmt=lambda: strategy(scaled_groups, scaled_countries),
+                number=number,
+                repeat=REPEAT
+            ))
+            print(f"{name:>20} = {seconds / number * 1000:.3f} ms per join")
 
-list_comp_time = timeit.timeit(stmt=list_comp, setup=setup, number=500)
 
-print(f"\nlist comprehension execution time = {list_comp_time}")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
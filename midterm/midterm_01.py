@@ -3,6 +3,8 @@
 from ast import Slice
 import csv
 
+from operator import itemgetter
+
 
 def calculate_vax_pct(target_demographic, census_demographic, precision=None):
     """Computes the < target_demographic > vaccination percentage by dividing the
@@ -91,7 +93,8 @@ def count_vaccinated(counties, headers, header_items):
     function < get_attribute > the task of retrieving the county's vaccinated residents
     and census population totals (vaccinated and unvaccinated) for a specified demographic
     (e.g., all residents, residents between 5 and 17 years old, residents 65 years and older).
-    The function < get_attribute > is called twice to retrieve the two values.
+    The column positions of both values are resolved once by calling < create_row_accessor >
+    rather than calling < get_attribute > (and scanning < headers >) twice per county.
 
     The < header_items > tuple provides the header names required for the two < get_attribute >
     calls. < header_items > is ordered as follows:
@@ -114,14 +117,61 @@ def count_vaccinated(counties, headers, header_items):
     """
     h1 = 0
     h2 = 0
-    item1, item2 = header_items
+    get_items = create_row_accessor(headers, *header_items)
     for country in counties:
-        h1 += get_attribute(country, headers, item1)
-        h2 += get_attribute(country, headers, item2)
+        item1, item2 = get_items(country)
+        h1 += item1
+        h2 += item2
     return (h1, h2)
 
 
 
+def create_key_index(rows, key):
+    """Returns a dictionary that maps each distinct < key > value found in < rows > to a list of
+    the rows that share that value. String values are casefolded so that lookups are
+    case-insensitive. Rows may be lists (pass a column index as the < key >) or dictionaries (pass
+    a column name as the < key >).
+
+    Parameters:
+        rows (iterable): nested "row" lists or dictionaries
+        key (int|str): index or name of the column to index on
+
+    Returns:
+        dict: rows grouped by their (casefolded) < key > value
+    """
+
+    index = {}
+    for row in rows:
+        value = row[key]
+        if isinstance(value, str):
+            value = value.casefold()
+        index.setdefault(value, []).append(row)
+    return index
+
+
+def create_row_accessor(headers, *columns):
+    """Returns a callable that retrieves from a nested "row" list the elements that correspond
+    to the passed in < columns > names. Each column's index is looked up in < headers > once
+    when the accessor is created rather than every time a row is read, so looping over many
+    rows costs no more than indexing each row directly.
+
+    If a single column name is passed the accessor returns the element; otherwise it returns a
+    tuple of elements ordered per < columns > (see operator.itemgetter).
+
+    WARN: the accessor captures the column positions at creation time. Create a new accessor
+    if columns are later inserted into or removed from < headers >.
+
+    Parameters:
+        headers (list): column names sourced from the first row of the CSV file
+        columns (str): one or more column names sourced from < headers >
+
+    Returns:
+        operator.itemgetter: callable that accepts a row and returns the matching element(s)
+    """
+
+    return itemgetter(*[headers.index(column) for column in columns])
+
+
 def get_attribute(county, headers, header):
     """Returns a < county > list element by looking up its index in the corresponding < headers >
     list using the < header > name as a filter.
@@ -170,6 +220,9 @@ def get_ur_scheme(ur_codes, county_name):
     Delegates to the function < convert_to_int > the task of converting the < ur_code > to
     an integer.
 
+    Retained for single-county lookups; < main > matches every county in one pass by calling
+    < join_rows > with < first=True >, which applies the same first-match rule.
+
     Parameters:
         ur_codes (list): nested lists of NCHS urban/rural codes and descriptors
         county_name (str): name of the county (e.g., 'Washtenaw County')
@@ -185,6 +238,55 @@ def get_ur_scheme(ur_codes, county_name):
     return None
 
 
+def join_rows(left, right, left_key, right_key, how='inner', first=False):
+    """Performs a hash equi-join of the < left > and < right > rows, matching the < left_key >
+    value of each left row to the < right_key > value of the right rows (case-insensitive).
+
+    The < right > rows are read once and indexed by calling < create_key_index >. The < left >
+    rows are then streamed, one at a time, and matched against the index. The < left > rows may
+    therefore be any iterable (e.g., a csv.reader) and are never held in memory by this
+    function. Pass the smaller of the two datasets as < right >.
+
+    The < how > argument determines the type of join performed:
+
+    'inner': yields a (< left row >, < right row >) tuple for each match
+    'left': as 'inner', but also yields (< left row >, None) for left rows without a match
+    'anti': yields (< left row >, None) only for left rows without a match
+
+    Left rows are yielded in their original order; a left row that matches more than one right
+    row is yielded once per match unless < first > is True, in which case it is paired with
+    its first match only (the match < get_ur_scheme > would return). Pass < first=True > when
+    the caller modifies each left row in place, so that no row is modified more than once.
+
+    Parameters:
+        left (iterable): nested "row" lists or dictionaries (probe side)
+        right (iterable): nested "row" lists or dictionaries (build side)
+        left_key (int|str): index or name of the < left > column to join on
+        right_key (int|str): index or name of the < right > column to join on
+        how (str): join type ('inner', 'left', or 'anti')
+        first (bool): if True yield at most one match per left row
+
+    Returns:
+        generator: (< left row >, < right row > | None) tuples
+    """
+
+    if how not in ('inner', 'left', 'anti'):
+        raise ValueError(f"Unsupported join type: {how}")
+
+    index = create_key_index(right, right_key)
+    for row in left:
+        value = row[left_key]
+        if isinstance(value, str):
+            value = value.casefold()
+        matches = index.get(value)
+        if matches:
+            if how != 'anti':
+                for match in matches[:1] if first else matches:
+                    yield row, match
+        elif how != 'inner':
+            yield row, None
+
+
 def read_csv(filepath, encoding='utf-8', newline='', delimiter=','):
     """
     Reads a CSV file, parsing row values per the provided delimiter. Returns a list of lists,
@@ -429,15 +531,15 @@ def main():
     # print(len(ur_schemes))
 
     # print(vax_headers)
-    for i in range(len(vax_counties)):
-        county_name = get_attribute(vax_counties[i], vax_headers, 'Recip_County')
-        # print(county_name)
-        # print(get_ur_scheme(ur_schemes, county_name))
-        cbsa_title, ur_code, ur_code_name = get_ur_scheme(ur_schemes, county_name)
-        vax_counties[i].insert(2, cbsa_title)
-        vax_counties[i].insert(3, ur_code)
-        vax_counties[i].insert(4, ur_code_name)
-            # print(element)
+    # Join on county name in a single pass (counties without a UR scheme get empty values)
+    county_idx = vax_headers.index('Recip_County')
+    ur_county_idx = ur_headers.index('county')
+    for county, ur_scheme in join_rows(
+        vax_counties, ur_schemes, county_idx, ur_county_idx, 'left', first=True):
+        if ur_scheme:
+            county[2:2] = [ur_scheme[2], convert_to_int(ur_scheme[3]), ur_scheme[4]]
+        else:
+            county[2:2] = ['', '', '']
 
 
 
@@ -476,8 +578,9 @@ def main():
     micropolitan = 0
     non_core = 0
     # print(vax_headers)
+    get_ur_code = create_row_accessor(ur_headers, "ur_code")
     for element in vax_counties:
-        ur_code = get_attribute(element, ur_headers, "ur_code")
+        ur_code = get_ur_code(element)
         if ur_code == 1 or ur_code == 2:
             large_central_and_fringe_metro += 1
         elif ur_code == 3 or ur_code == 4:
@@ -3,6 +3,46 @@ import pprint
 
 import requests
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_POOL_SIZE = 10 # connections kept alive per host
+HTTP_TIMEOUT = 10 # seconds
+HTTP_RETRIES = 3 # transport-level retries per GET request
+HTTP_BACKOFF_FACTOR = 0.5 # seconds; base of the exponential backoff
+HTTP_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def create_session(pool_size=HTTP_POOL_SIZE, retries=HTTP_RETRIES,
+                   backoff_factor=HTTP_BACKOFF_FACTOR, status_forcelist=HTTP_RETRY_STATUSES):
+    """Returns a new < requests.Session > whose transport adapters keep up to < pool_size >
+    keep-alive connections open per host. Failed GET requests (connection errors and responses
+    whose status code is in < status_forcelist >) are retried up to < retries > times with
+    exponential backoff.
+
+    Parameters:
+        pool_size (int): connections kept alive per host
+        retries (int): maximum number of retries per request
+        backoff_factor (float): backoff factor applied between retries
+        status_forcelist (tuple): HTTP status codes that trigger a retry
+
+    Returns:
+        requests.Session: configured session
+    """
+
+    retry = Retry(total=retries, backoff_factor=backoff_factor,
+                  status_forcelist=status_forcelist, allowed_methods=('GET',),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    new_session = requests.Session()
+    new_session.mount('https://', adapter)
+    new_session.mount('http://', adapter)
+    return new_session
+
+
+# Shared session: reuses keep-alive connections across requests
+session = create_session()
+
 
 # HELPER FUNCTION. DO NOT ALTER
 def read_json(filepath, encoding='utf-8'):
@@ -64,7 +104,7 @@ def get_character_info(person, characteristics):
     return {key: person[key] for key in person.keys() if key in characteristics}
 
 
-def get_swapi_resource(url, params=None):
+def get_swapi_resource(url, params=None, timeout=HTTP_TIMEOUT):
     """Returns a response object decoded into a dictionary. If query string < params > are
     provided the response object body is returned in the form on an "envelope" with the data
     payload of one or more SWAPI entities to be found in ['results'] list; otherwise, response
@@ -73,14 +113,15 @@ def get_swapi_resource(url, params=None):
     Parameters:
         url (str): a url that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds.
 
     Returns:
         dict: dictionary representation of the decoded JSON.
     """
     if params:
-        return requests.get(url, params).json()
+        return session.get(url, params=params, timeout=timeout).json()
     else:
-        return requests.get(url).json()
+        return session.get(url, timeout=timeout).json()
 
 
 def request_resource_details(base_url, category=None, params=None):
@@ -458,18 +458,23 @@ def get_mandalorian_data(mandalorian_data, filter):
     passed in < filter > value. If a match is obtained the dictionary is returned to the
     caller; otherwise None is returned.
 
+    < mandalorian_data > may instead be an index built once per dataset by
+    < utl.create_name_index >, in which case each call is a single dictionary lookup rather
+    than a pass over the list.
+
     Parameters:
-        mandalorian_data (list): Wookieepedia-sourced data stored in a list of nested dictionaries.
+        mandalorian_data (list|dict): Wookieepedia-sourced data stored in a list of nested
+                                      dictionaries, or an index of that list.
         filter (str): name value used to match on a dictionary's "name" value.
 
     Returns
         dict|None: Wookieepedia-sourced data dictionary if match on the filter is obtained;
                    otherwise returns None.
     """
-    for data in mandalorian_data:
-        if filter.lower() == data['name'].lower():
-            return data
-    return None
+    if not isinstance(mandalorian_data, dict):
+        mandalorian_data = utl.create_name_index(mandalorian_data)
+    matches = mandalorian_data.get(filter.casefold())
+    return matches[0] if matches else None
 
 
 def get_swapi_resource(url, params=None, timeout=10):
@@ -537,6 +542,12 @@ def main():
     mandalorian_starships = utl.read_json('mandalorian_starships.json')
     mandalorian_planets = utl.read_json('mandalorian_planets.json')
     mandalorian_droids = utl.read_json('mandalorian_droids.json')
+
+    # Index each dataset once by name; every lookup below is then a dictionary lookup
+    mandalorian_people = utl.create_name_index(mandalorian_people)
+    mandalorian_starships = utl.create_name_index(mandalorian_starships)
+    mandalorian_planets = utl.create_name_index(mandalorian_planets)
+    mandalorian_droids = utl.create_name_index(mandalorian_droids)
     mandalorian_vehicles = utl.read_json('mandalorian_vehicles.json')
 
     # PROBLEM 02